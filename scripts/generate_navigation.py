@@ -33,10 +33,12 @@ class ForumInfo:
 # Handle imports for both direct execution and pytest
 try:
     from scripts.config import load_config
-    from scripts.thread_metadata import extract_thread_metadata
+    from scripts.thread_metadata import extract_many_thread_metadata
 except ModuleNotFoundError:
     from config import load_config  # type: ignore[import-not-found, no-redef]
-    from thread_metadata import extract_thread_metadata  # type: ignore[import-not-found, no-redef]
+    from thread_metadata import (  # type: ignore[import-not-found, no-redef]
+        extract_many_thread_metadata,
+    )
 
 
 def scan_exports(public_dir: Path) -> list[dict]:
@@ -593,7 +595,8 @@ def collect_forum_threads(forum_dir: Path) -> list[dict]:
     Returns:
         List of thread metadata dictionaries
     """
-    threads = []
+    thread_dirs = []
+    json_files = []
 
     # Iterate through thread directories
     for thread_dir in forum_dir.iterdir():
@@ -601,15 +604,19 @@ def collect_forum_threads(forum_dir: Path) -> list[dict]:
             continue
 
         # More efficient: use recursive glob to find any JSON in subdirectories
-        json_files = list(thread_dir.glob("*/*.json"))
-        if not json_files:
+        thread_jsons = list(thread_dir.glob("*/*.json"))
+        if not thread_jsons:
             continue
 
         # Use first JSON file found (usually there's only one per thread)
-        json_file = json_files[0]
+        thread_dirs.append(thread_dir)
+        json_files.append(thread_jsons[0])
 
-        # Extract metadata
-        metadata = extract_thread_metadata(json_file)
+    # Extract metadata for every thread in one batch
+    threads = []
+    for thread_dir, metadata in zip(
+        thread_dirs, extract_many_thread_metadata(json_files), strict=True
+    ):
         if metadata:
             threads.append(
                 {
@@ -50,9 +50,12 @@ class StateManager:
 
     def save(self) -> None:
         """Save state to disk."""
+        # Encode in one go and hand the file a single write; `json.dump`
+        # would stream every token through its own `f.write` call.
+        payload = json.dumps(self.state, indent=2)
         try:
             with open(self.state_path, "w", encoding="utf-8") as f:
-                json.dump(self.state, f, indent=2)
+                f.write(payload)
         except OSError as e:
             raise RuntimeError(f"Failed to save state to {self.state_path}: {e}") from e
 
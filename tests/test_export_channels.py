@@ -1,10 +1,12 @@
 # tests/test_export_channels.py
+import json
 import os
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
+from scripts.channel_classifier import ChannelType
 from scripts.export_channels import (
     ChannelExportContext,
     ChannelInfo,
@@ -14,6 +16,7 @@ from scripts.export_channels import (
     format_export_command,
     get_bot_token,
     should_include_channel,
+    write_channel_order,
 )
 
 
@@ -176,11 +179,6 @@ def test_export_one_month_current_month_is_bounded(tmp_path: Path) -> None:
 def test_write_channel_order_captures_guild_order_and_category(tmp_path: Path) -> None:
     """write_channel_order records non-thread channels in guild order with their
     category, so navigation can group + sort like the server (issue #5)."""
-    import json
-
-    from scripts.channel_classifier import ChannelType
-    from scripts.export_channels import write_channel_order
-
     channels: list[dict[str, str | None]] = [
         {"name": "general", "id": "1", "parent_id": "Information"},
         {"name": "questions", "id": "2", "parent_id": "Information"},
@@ -2,7 +2,6 @@
 """Tests for export orchestration functionality."""
 
 import os
-import tempfile
 from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
@@ -91,12 +90,11 @@ class TestRunExport:
 class TestExportAllChannels:
     """Tests for export_all_channels orchestration function."""
 
-    def test_export_all_channels_loads_config(self) -> None:
+    def test_export_all_channels_loads_config(self, tmp_path: Path) -> None:
         """Test that export_all_channels loads configuration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create temporary config file
-            config_path = Path(tmpdir) / "config.toml"
-            config_path.write_text("""
+        # Create temporary config file
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("""
 [site]
 title = "Test Server"
 
@@ -115,39 +113,39 @@ pages_branch = "gh-pages"
 commit_author = "Test Bot"
 """)
 
-            state_path = Path(tmpdir) / "state.json"
-            state_path.write_text("{}")
-
-            # Set environment variable
-            os.environ["DISCORD_BOT_TOKEN"] = "test_token"
-
-            with patch("scripts.export_channels.load_config") as mock_load:
-                mock_load.return_value = {
-                    "site": {"title": "Test"},
-                    "servers": {
-                        "test-server": {
-                            "name": "Test Server",
-                            "guild_id": "123456789",
-                            "include_channels": ["*"],
-                            "exclude_channels": [],
-                        }
-                    },
-                    "export": {"formats": ["html"]},
-                    "github": {},
-                }
+        state_path = tmp_path / "state.json"
+        state_path.write_text("{}")
 
-                with patch("scripts.export_channels.fetch_guild_channels") as mock_fetch:
-                    mock_fetch.return_value = ([], {})
+        # Set environment variable
+        os.environ["DISCORD_BOT_TOKEN"] = "test_token"
 
-                    with patch("scripts.export_channels.StateManager"):
-                        with patch("scripts.export_channels.Path"):
-                            summary = export_all_channels()
+        with patch("scripts.export_channels.load_config") as mock_load:
+            mock_load.return_value = {
+                "site": {"title": "Test"},
+                "servers": {
+                    "test-server": {
+                        "name": "Test Server",
+                        "guild_id": "123456789",
+                        "include_channels": ["*"],
+                        "exclude_channels": [],
+                    }
+                },
+                "export": {"formats": ["html"]},
+                "github": {},
+            }
+
+            with patch("scripts.export_channels.fetch_guild_channels") as mock_fetch:
+                mock_fetch.return_value = ([], {})
 
-                            mock_load.assert_called_once()
-                            assert "channels_updated" in summary
-                            assert "channels_failed" in summary
+                with patch("scripts.export_channels.StateManager"):
+                    with patch("scripts.export_channels.Path"):
+                        summary = export_all_channels()
 
-            del os.environ["DISCORD_BOT_TOKEN"]
+                        mock_load.assert_called_once()
+                        assert "channels_updated" in summary
+                        assert "channels_failed" in summary
+
+        del os.environ["DISCORD_BOT_TOKEN"]
 
     def test_export_all_channels_initializes_state_manager(self) -> None:
         """Test that state manager is initialized and loaded."""
@@ -622,23 +620,22 @@ commit_author = "Test Bot"
         """Test that exports directory is created."""
         os.environ["DISCORD_BOT_TOKEN"] = "test_token"
 
-        with tempfile.TemporaryDirectory():
-            config = {"site": {}, "servers": {}, "export": {"formats": ["html"]}, "github": {}}
+        config = {"site": {}, "servers": {}, "export": {"formats": ["html"]}, "github": {}}
 
-            with patch("scripts.export_channels.load_config", return_value=config):
-                with patch("scripts.export_channels.StateManager") as mock_state_class:
-                    mock_state = Mock()
-                    mock_state_class.return_value = mock_state
-                    mock_state.load.return_value = {}
+        with patch("scripts.export_channels.load_config", return_value=config):
+            with patch("scripts.export_channels.StateManager") as mock_state_class:
+                mock_state = Mock()
+                mock_state_class.return_value = mock_state
+                mock_state.load.return_value = {}
 
-                    with patch("scripts.export_channels.Path") as mock_path_class:
-                        mock_exports_path = Mock()
-                        mock_path_class.return_value = mock_exports_path
+                with patch("scripts.export_channels.Path") as mock_path_class:
+                    mock_exports_path = Mock()
+                    mock_path_class.return_value = mock_exports_path
 
-                        export_all_channels()
+                    export_all_channels()
 
-                        # Should call mkdir on exports directory
-                        mock_exports_path.mkdir.assert_called()
+                    # Should call mkdir on exports directory
+                    mock_exports_path.mkdir.assert_called()
 
         del os.environ["DISCORD_BOT_TOKEN"]
 
@@ -719,7 +716,7 @@ commit_author = "Test Bot"
 
         del os.environ["DISCORD_BOT_TOKEN"]
 
-    def test_export_all_channels_tracks_thread_state(self) -> None:
+    def test_export_all_channels_tracks_thread_state(self, tmp_path: Path) -> None:
         """Test that thread exports update state."""
         os.environ["DISCORD_BOT_TOKEN"] = "test_token"
 
@@ -741,46 +738,45 @@ commit_author = "Test Bot"
         with patch("scripts.export_channels.load_config", return_value=config):
             with patch("scripts.export_channels.fetch_guild_channels") as mock_fetch:
                 with patch("scripts.export_channels.run_export") as mock_run:
-                    with tempfile.TemporaryDirectory() as tmpdir:
-                        with patch("scripts.export_channels.Path") as mock_path:
-                            # Setup mocks
-                            mock_fetch.return_value = (
-                                [
-                                    {"name": "questions", "id": "999", "parent_id": None},
-                                    {
-                                        "name": "How to start?",
-                                        "id": "111",
-                                        "parent_id": "questions",
-                                    },
-                                ],
-                                {},
-                            )
-
-                            mock_run.return_value = (True, "")
-
-                            # Mock Path to use temp directory
-                            exports_dir = Path(tmpdir) / "exports"
-                            exports_dir.mkdir(parents=True)
-                            mock_path.return_value = exports_dir
-
-                            # Mock StateManager
-                            with patch("scripts.export_channels.StateManager") as mock_state_class:
-                                mock_state = Mock()
-                                mock_state_class.return_value = mock_state
-                                mock_state.get_channel_state.return_value = None
-                                mock_state.get_thread_state.return_value = None
-
-                                # Run export
-                                _ = export_all_channels()
-
-                                # Verify thread state was updated
-                                mock_state.update_thread_state.assert_called_once()
-                                call_args = mock_state.update_thread_state.call_args
-                                assert call_args[1]["server"] == "test-server"
-                                assert call_args[1]["forum"] == "questions"
-                                # ThreadInfo is passed as thread_info parameter
-                                thread_info = call_args[1]["thread_info"]
-                                assert thread_info.thread_id == "111"
+                    with patch("scripts.export_channels.Path") as mock_path:
+                        # Setup mocks
+                        mock_fetch.return_value = (
+                            [
+                                {"name": "questions", "id": "999", "parent_id": None},
+                                {
+                                    "name": "How to start?",
+                                    "id": "111",
+                                    "parent_id": "questions",
+                                },
+                            ],
+                            {},
+                        )
+
+                        mock_run.return_value = (True, "")
+
+                        # Mock Path to use temp directory
+                        exports_dir = tmp_path / "exports"
+                        exports_dir.mkdir(parents=True)
+                        mock_path.return_value = exports_dir
+
+                        # Mock StateManager
+                        with patch("scripts.export_channels.StateManager") as mock_state_class:
+                            mock_state = Mock()
+                            mock_state_class.return_value = mock_state
+                            mock_state.get_channel_state.return_value = None
+                            mock_state.get_thread_state.return_value = None
+
+                            # Run export
+                            _ = export_all_channels()
+
+                            # Verify thread state was updated
+                            mock_state.update_thread_state.assert_called_once()
+                            call_args = mock_state.update_thread_state.call_args
+                            assert call_args[1]["server"] == "test-server"
+                            assert call_args[1]["forum"] == "questions"
+                            # ThreadInfo is passed as thread_info parameter
+                            thread_info = call_args[1]["thread_info"]
+                            assert thread_info.thread_id == "111"
 
         del os.environ["DISCORD_BOT_TOKEN"]
 
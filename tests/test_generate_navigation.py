@@ -1,14 +1,18 @@
 # tests/test_generate_navigation.py
 import json
-import tempfile
 from pathlib import Path
 
 from scripts.generate_navigation import (
+    ForumInfo,
+    collect_forum_threads,
     count_messages_from_json,
     generate_channel_index,
+    generate_forum_index,
     generate_server_index,
     generate_site_index,
     group_by_year,
+    group_channels_by_category,
+    load_channel_order,
     organize_data,
     scan_exports,
 )
@@ -23,100 +27,96 @@ EXPECTED_THREE_MESSAGES = 3
 EXPECTED_MESSAGE_COUNT_FIVE = 5
 
 
-def test_organize_data_reads_json_from_month_directory() -> None:
+def test_organize_data_reads_json_from_month_directory(tmp_path: Path) -> None:
     """The JSON sits at `<channel>/<YYYY-MM>/<YYYY-MM>.json`, not next to the dir.
 
     Regression: an earlier version read from `<channel>/<YYYY-MM>.json`
     (the directory itself, not the file inside it), which always returned
     0 messages and made every archive say "0 messages" on the channel index.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        public = Path(tmpdir) / "public"
-        month_dir = public / "test-server" / "general" / "2026-05"
-        month_dir.mkdir(parents=True)
+    public = tmp_path / "public"
+    month_dir = public / "test-server" / "general" / "2026-05"
+    month_dir.mkdir(parents=True)
 
-        # The HTML the scan picks up
-        (month_dir / "2026-05.html").write_text("<html>may</html>")
-        # The JSON whose messages we want to count
-        json_data = {"messages": [{"id": str(i), "content": f"msg{i}"} for i in range(5)]}
-        (month_dir / "2026-05.json").write_text(json.dumps(json_data))
+    # The HTML the scan picks up
+    (month_dir / "2026-05.html").write_text("<html>may</html>")
+    # The JSON whose messages we want to count
+    json_data = {"messages": [{"id": str(i), "content": f"msg{i}"} for i in range(5)]}
+    (month_dir / "2026-05.json").write_text(json.dumps(json_data))
 
-        exports = scan_exports(public)
-        data = organize_data(exports, public)
+    exports = scan_exports(public)
+    data = organize_data(exports, public)
 
-        assert "test-server" in data
-        channel = data["test-server"]["channels"]["general"]
-        assert channel["archives"][0]["date"] == "2026-05"
-        assert channel["archives"][0]["message_count"] == EXPECTED_MESSAGE_COUNT_FIVE
+    assert "test-server" in data
+    channel = data["test-server"]["channels"]["general"]
+    assert channel["archives"][0]["date"] == "2026-05"
+    assert channel["archives"][0]["message_count"] == EXPECTED_MESSAGE_COUNT_FIVE
 
 
-def test_scan_exports_finds_files() -> None:
+def test_scan_exports_finds_files(tmp_path: Path) -> None:
     """Test that scan_exports finds exported files"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create fake export structure: public/server/channel/YYYY-MM/YYYY-MM.html
-        public = Path(tmpdir) / "public"
-        month_dir = public / "test-server" / "general" / "2025-01"
-        month_dir.mkdir(parents=True)
+    # Create fake export structure: public/server/channel/YYYY-MM/YYYY-MM.html
+    public = tmp_path / "public"
+    month_dir = public / "test-server" / "general" / "2025-01"
+    month_dir.mkdir(parents=True)
 
-        (month_dir / "2025-01.html").touch()
-        (month_dir / "2025-01.json").touch()
-        (month_dir / "2025-01.txt").touch()
+    (month_dir / "2025-01.html").touch()
+    (month_dir / "2025-01.json").touch()
+    (month_dir / "2025-01.txt").touch()
 
-        exports = scan_exports(public)
+    exports = scan_exports(public)
 
-        assert len(exports) > 0
-        assert any(e["channel"] == "general" for e in exports)
+    assert len(exports) > 0
+    assert any(e["channel"] == "general" for e in exports)
 
 
-def test_scan_exports_skips_index_files() -> None:
+def test_scan_exports_skips_index_files(tmp_path: Path) -> None:
     """Test that scan_exports skips index.html files"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        public = Path(tmpdir) / "public"
-        month_dir = public / "test-server" / "general" / "2025-01"
-        month_dir.mkdir(parents=True)
+    public = tmp_path / "public"
+    month_dir = public / "test-server" / "general" / "2025-01"
+    month_dir.mkdir(parents=True)
 
-        (month_dir / "2025-01.html").touch()
-        (month_dir / "index.html").touch()
-        (public / "index.html").touch()
+    (month_dir / "2025-01.html").touch()
+    (month_dir / "index.html").touch()
+    (public / "index.html").touch()
 
-        exports = scan_exports(public)
+    exports = scan_exports(public)
 
-        # Should only find 2025-01.html, not the index files
-        assert len(exports) == 1
-        assert exports[0]["date"] == "2025-01"
+    # Should only find 2025-01.html, not the index files
+    assert len(exports) == 1
+    assert exports[0]["date"] == "2025-01"
 
 
-def test_scan_exports_multiple_channels() -> None:
+def test_scan_exports_multiple_channels(tmp_path: Path) -> None:
     """Test scanning multiple channels and servers"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        public = Path(tmpdir) / "public"
+    public = tmp_path / "public"
 
-        # Create multiple servers and channels with month directories
-        s1_general = public / "server1" / "general" / "2025-01"
-        s1_general.mkdir(parents=True)
-        (s1_general / "2025-01.html").touch()
+    # Create multiple servers and channels with month directories
+    s1_general = public / "server1" / "general" / "2025-01"
+    s1_general.mkdir(parents=True)
+    (s1_general / "2025-01.html").touch()
 
-        s1_announce = public / "server1" / "announcements" / "2025-01"
-        s1_announce.mkdir(parents=True)
-        (s1_announce / "2025-01.html").touch()
+    s1_announce = public / "server1" / "announcements" / "2025-01"
+    s1_announce.mkdir(parents=True)
+    (s1_announce / "2025-01.html").touch()
 
-        s2_chat = public / "server2" / "chat" / "2025-02"
-        s2_chat.mkdir(parents=True)
-        (s2_chat / "2025-02.html").touch()
+    s2_chat = public / "server2" / "chat" / "2025-02"
+    s2_chat.mkdir(parents=True)
+    (s2_chat / "2025-02.html").touch()
 
-        exports = scan_exports(public)
+    exports = scan_exports(public)
 
-        assert len(exports) == EXPECTED_THREE_EXPORTS
-        servers = {e["server"] for e in exports}
-        channels = {e["channel"] for e in exports}
-        assert "server1" in servers
-        assert "server2" in servers
-        assert "general" in channels
-        assert "announcements" in channels
-        assert "chat" in channels
+    assert len(exports) == EXPECTED_THREE_EXPORTS
+    servers = {e["server"] for e in exports}
+    channels = {e["channel"] for e in exports}
+    assert "server1" in servers
+    assert "server2" in servers
+    assert "general" in channels
+    assert "announcements" in channels
+    assert "chat" in channels
 
 
-def test_count_messages_from_json() -> None:
+def test_count_messages_from_json(tmp_path: Path) -> None:
     """Test counting messages from JSON file in DiscordChatExporter format"""
     sample_export = {
         "guild": {"id": "123", "name": "Test"},
@@ -128,17 +128,14 @@ def test_count_messages_from_json() -> None:
         ],
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(sample_export, f)
-        json_path = f.name
+    json_path = tmp_path / "export.json"
+    json_path.write_text(json.dumps(sample_export))
 
-    count = count_messages_from_json(json_path)
+    count = count_messages_from_json(str(json_path))
     assert count == EXPECTED_THREE_MESSAGES
 
-    Path(json_path).unlink()
 
-
-def test_count_messages_from_json_empty_messages_array() -> None:
+def test_count_messages_from_json_empty_messages_array(tmp_path: Path) -> None:
     """Test counting messages with empty messages array"""
     sample_export = {
         "guild": {"id": "123", "name": "Test"},
@@ -146,15 +143,12 @@ def test_count_messages_from_json_empty_messages_array() -> None:
         "messages": [],
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(sample_export, f)
-        json_path = f.name
+    json_path = tmp_path / "export.json"
+    json_path.write_text(json.dumps(sample_export))
 
-    count = count_messages_from_json(json_path)
+    count = count_messages_from_json(str(json_path))
     assert count == 0
 
-    Path(json_path).unlink()
-
 
 def test_count_messages_from_json_nonexistent() -> None:
     """Test counting messages from nonexistent file returns 0"""
@@ -195,79 +189,74 @@ def test_group_by_year_sorted() -> None:
     assert grouped["2025"][2]["date"] == "2025-01"
 
 
-def test_generate_site_index() -> None:
+def test_generate_site_index(tmp_path: Path) -> None:
     """Test generating site index page"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "public" / "index.html"
+    output_path = tmp_path / "public" / "index.html"
 
-        config = {"site": {"title": "Test Discord Logs", "description": "Test description"}}
+    config = {"site": {"title": "Test Discord Logs", "description": "Test description"}}
 
-        servers = [
-            {
-                "name": "test-server",
-                "display_name": "Test Server",
-                "channel_count": 5,
-                "last_updated": "2025-01-15 14:00 UTC",
-            }
-        ]
+    servers = [
+        {
+            "name": "test-server",
+            "display_name": "Test Server",
+            "channel_count": 5,
+            "last_updated": "2025-01-15 14:00 UTC",
+        }
+    ]
 
-        generate_site_index(config, servers, output_path)
+    generate_site_index(config, servers, output_path)
 
-        assert output_path.exists()
-        html = output_path.read_text()
-        assert "Test Discord Logs" in html
-        assert "Test Server" in html
-        assert "5 channels" in html
+    assert output_path.exists()
+    html = output_path.read_text()
+    assert "Test Discord Logs" in html
+    assert "Test Server" in html
+    assert "5 channels" in html
 
 
-def test_generate_server_index() -> None:
+def test_generate_server_index(tmp_path: Path) -> None:
     """Test generating server index page"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "public" / "test-server" / "index.html"
+    output_path = tmp_path / "public" / "test-server" / "index.html"
 
-        config = {"site": {"title": "Test Discord Logs"}}
+    config = {"site": {"title": "Test Discord Logs"}}
 
-        server = {"name": "test-server", "display_name": "Test Server"}
+    server = {"name": "test-server", "display_name": "Test Server"}
 
-        channels = [{"name": "general", "message_count": 100, "archive_count": 3, "archives": []}]
+    channels = [{"name": "general", "message_count": 100, "archive_count": 3, "archives": []}]
 
-        generate_server_index(config, server, channels, output_path)
+    generate_server_index(config, server, channels, output_path)
 
-        assert output_path.exists()
-        html = output_path.read_text()
-        assert "Test Server" in html
-        assert "#general" in html
+    assert output_path.exists()
+    html = output_path.read_text()
+    assert "Test Server" in html
+    assert "#general" in html
 
 
-def test_generate_channel_index() -> None:
+def test_generate_channel_index(tmp_path: Path) -> None:
     """Test generating channel index page"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "public" / "test-server" / "general" / "index.html"
+    output_path = tmp_path / "public" / "test-server" / "general" / "index.html"
 
-        config = {"site": {"title": "Test Discord Logs"}}
+    config = {"site": {"title": "Test Discord Logs"}}
 
-        server = {"name": "test-server", "display_name": "Test Server"}
+    server = {"name": "test-server", "display_name": "Test Server"}
 
-        channel = {"name": "general"}
+    channel = {"name": "general"}
 
-        archives = [
-            {"date": "2025-01", "message_count": 100},
-            {"date": "2025-02", "message_count": 150},
-        ]
+    archives = [
+        {"date": "2025-01", "message_count": 100},
+        {"date": "2025-02", "message_count": 150},
+    ]
 
-        generate_channel_index(config, server, channel, archives, output_path)
+    generate_channel_index(config, server, channel, archives, output_path)
 
-        assert output_path.exists()
-        html = output_path.read_text()
-        assert "#general" in html
-        assert "2025-01" in html
-        assert "2025-02" in html
+    assert output_path.exists()
+    html = output_path.read_text()
+    assert "#general" in html
+    assert "2025-01" in html
+    assert "2025-02" in html
 
 
-def test_generate_forum_index() -> None:
+def test_generate_forum_index(tmp_path: Path) -> None:
     """Test forum index generation."""
-    from scripts.generate_navigation import ForumInfo, generate_forum_index
-
     # Setup
     config = {"site": {"title": "Test Site"}}
     server_info = {"name": "test-server", "display_name": "Test Server"}
@@ -291,137 +280,114 @@ def test_generate_forum_index() -> None:
         },
     ]
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "index.html"
+    output_path = tmp_path / "index.html"
 
-        forum_info = ForumInfo(name="questions", description="Ask questions")
-        generate_forum_index(
-            config,
-            server_info,
-            forum_info,
-            threads_data,
-            output_path,
-        )
+    forum_info = ForumInfo(name="questions", description="Ask questions")
+    generate_forum_index(
+        config,
+        server_info,
+        forum_info,
+        threads_data,
+        output_path,
+    )
 
-        html = output_path.read_text()
+    html = output_path.read_text()
 
-        assert "<!DOCTYPE html>" in html
-        assert "Questions" in html or "questions" in html
-        assert "Ask questions" in html
-        assert "How to start?" in html
-        assert "5 replies" in html
-        assert "Old Thread" in html
-        assert "10 replies" in html
+    assert "<!DOCTYPE html>" in html
+    assert "Questions" in html or "questions" in html
+    assert "Ask questions" in html
+    assert "How to start?" in html
+    assert "5 replies" in html
+    assert "Old Thread" in html
+    assert "10 replies" in html
 
 
-def test_collect_forum_threads() -> None:
+def test_collect_forum_threads(tmp_path: Path) -> None:
     """Test collecting thread metadata from forum directory."""
-    import json
-    import tempfile
-    from pathlib import Path
-
-    from scripts.generate_navigation import collect_forum_threads
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create forum directory structure
-        forum_dir = Path(tmpdir) / "questions"
-        forum_dir.mkdir()
-
-        # Create thread directories with JSON files
-        thread1_dir = forum_dir / "how-to-start"
-        thread1_dir.mkdir()
-
-        thread1_json = {
-            "channel": {"name": "How to start?"},
-            "messages": [
-                {"id": "1", "timestamp": "2025-11-01T10:00:00Z", "content": "msg1"},
-                {"id": "2", "timestamp": "2025-11-10T15:00:00Z", "content": "msg2"},
-            ],
-        }
-        (thread1_dir / "2025-11" / "2025-11.json").parent.mkdir(parents=True, exist_ok=True)
-        with open(thread1_dir / "2025-11" / "2025-11.json", "w") as f:
-            json.dump(thread1_json, f)
+    # Create forum directory structure
+    forum_dir = tmp_path / "questions"
+    forum_dir.mkdir()
 
-        # Collect threads
-        threads = collect_forum_threads(forum_dir)
+    # Create thread directories with JSON files
+    thread1_dir = forum_dir / "how-to-start"
+    thread1_dir.mkdir()
 
-        assert len(threads) == 1
-        assert threads[0]["name"] == "how-to-start"
-        assert threads[0]["title"] == "How to start?"
-        assert threads[0]["reply_count"] == EXPECTED_REPLY_COUNT
-        assert threads[0]["last_activity"] == "2025-11-10"
+    thread1_json = {
+        "channel": {"name": "How to start?"},
+        "messages": [
+            {"id": "1", "timestamp": "2025-11-01T10:00:00Z", "content": "msg1"},
+            {"id": "2", "timestamp": "2025-11-10T15:00:00Z", "content": "msg2"},
+        ],
+    }
+    (thread1_dir / "2025-11" / "2025-11.json").parent.mkdir(parents=True, exist_ok=True)
+    with open(thread1_dir / "2025-11" / "2025-11.json", "w") as f:
+        json.dump(thread1_json, f)
 
+    # Collect threads
+    threads = collect_forum_threads(forum_dir)
 
-def test_collect_forum_threads_multiple() -> None:
-    """Test collecting metadata from multiple threads, sorted by activity."""
-    import json
-    import tempfile
-    from pathlib import Path
-
-    from scripts.generate_navigation import collect_forum_threads
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        forum_dir = Path(tmpdir) / "questions"
-        forum_dir.mkdir()
-
-        # Create thread 1 (older)
-        thread1_dir = forum_dir / "old-thread"
-        thread1_dir.mkdir()
-        thread1_json = {
-            "channel": {"name": "Old Thread"},
-            "messages": [
-                {"id": "1", "timestamp": "2025-01-15T10:00:00Z", "content": "msg1"},
-            ],
-        }
-        (thread1_dir / "2025-01" / "2025-01.json").parent.mkdir(parents=True)
-        with open(thread1_dir / "2025-01" / "2025-01.json", "w") as f:
-            json.dump(thread1_json, f)
-
-        # Create thread 2 (newer)
-        thread2_dir = forum_dir / "new-thread"
-        thread2_dir.mkdir()
-        thread2_json = {
-            "channel": {"name": "New Thread"},
-            "messages": [
-                {"id": "1", "timestamp": "2025-11-10T10:00:00Z", "content": "msg1"},
-            ],
-        }
-        (thread2_dir / "2025-11" / "2025-11.json").parent.mkdir(parents=True)
-        with open(thread2_dir / "2025-11" / "2025-11.json", "w") as f:
-            json.dump(thread2_json, f)
+    assert len(threads) == 1
+    assert threads[0]["name"] == "how-to-start"
+    assert threads[0]["title"] == "How to start?"
+    assert threads[0]["reply_count"] == EXPECTED_REPLY_COUNT
+    assert threads[0]["last_activity"] == "2025-11-10"
 
-        # Collect threads
-        threads = collect_forum_threads(forum_dir)
 
-        assert len(threads) == EXPECTED_THREAD_COUNT
-        # Should be sorted by last_activity, newest first
-        assert threads[0]["name"] == "new-thread"
-        assert threads[0]["last_activity"] == "2025-11-10"
-        assert threads[1]["name"] == "old-thread"
-        assert threads[1]["last_activity"] == "2025-01-15"
+def test_collect_forum_threads_multiple(tmp_path: Path) -> None:
+    """Test collecting metadata from multiple threads, sorted by activity."""
+    forum_dir = tmp_path / "questions"
+    forum_dir.mkdir()
+
+    # Create thread 1 (older)
+    thread1_dir = forum_dir / "old-thread"
+    thread1_dir.mkdir()
+    thread1_json = {
+        "channel": {"name": "Old Thread"},
+        "messages": [
+            {"id": "1", "timestamp": "2025-01-15T10:00:00Z", "content": "msg1"},
+        ],
+    }
+    (thread1_dir / "2025-01" / "2025-01.json").parent.mkdir(parents=True)
+    with open(thread1_dir / "2025-01" / "2025-01.json", "w") as f:
+        json.dump(thread1_json, f)
+
+    # Create thread 2 (newer)
+    thread2_dir = forum_dir / "new-thread"
+    thread2_dir.mkdir()
+    thread2_json = {
+        "channel": {"name": "New Thread"},
+        "messages": [
+            {"id": "1", "timestamp": "2025-11-10T10:00:00Z", "content": "msg1"},
+        ],
+    }
+    (thread2_dir / "2025-11" / "2025-11.json").parent.mkdir(parents=True)
+    with open(thread2_dir / "2025-11" / "2025-11.json", "w") as f:
+        json.dump(thread2_json, f)
 
+    # Collect threads
+    threads = collect_forum_threads(forum_dir)
 
-def test_collect_forum_threads_empty_directory() -> None:
-    """Test collecting threads from empty forum directory."""
-    import tempfile
-    from pathlib import Path
+    assert len(threads) == EXPECTED_THREAD_COUNT
+    # Should be sorted by last_activity, newest first
+    assert threads[0]["name"] == "new-thread"
+    assert threads[0]["last_activity"] == "2025-11-10"
+    assert threads[1]["name"] == "old-thread"
+    assert threads[1]["last_activity"] == "2025-01-15"
 
-    from scripts.generate_navigation import collect_forum_threads
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        forum_dir = Path(tmpdir) / "questions"
-        forum_dir.mkdir()
+def test_collect_forum_threads_empty_directory(tmp_path: Path) -> None:
+    """Test collecting threads from empty forum directory."""
+    forum_dir = tmp_path / "questions"
+    forum_dir.mkdir()
 
-        threads = collect_forum_threads(forum_dir)
+    threads = collect_forum_threads(forum_dir)
 
-        assert threads == []
+    assert threads == []
 
 
 def test_group_channels_by_category_orders_by_guild_order() -> None:
     """Channels group under their category, categories and channels ordered the
     way the guild lists them (issue #5)."""
-    from scripts.generate_navigation import group_channels_by_category
-
     channels = [
         {"name": "Information/general", "category": "Information"},
         {"name": "Designing/analog", "category": "Designing"},
@@ -442,8 +408,6 @@ def test_group_channels_by_category_orders_by_guild_order() -> None:
 def test_group_channels_unknown_sorts_last_alphabetically() -> None:
     """A channel missing from the guild order (e.g. brand new) sorts to the end
     of its category alphabetically — never dropped."""
-    from scripts.generate_navigation import group_channels_by_category
-
     channels = [
         {"name": "Information/zeta", "category": "Information"},
         {"name": "Information/alpha", "category": "Information"},  # not in order
@@ -462,6 +426,4 @@ def test_group_channels_unknown_sorts_last_alphabetically() -> None:
 
 def test_load_channel_order_missing_is_empty(tmp_path: Path) -> None:
     """A missing sidecar yields an empty order (alphabetical fallback)."""
-    from scripts.generate_navigation import load_channel_order
-
     assert load_channel_order(tmp_path, "nope") == []
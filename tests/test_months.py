@@ -1,5 +1,6 @@
 """Tests for the months module: month range computation and snowflake conversion."""
 
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
@@ -7,9 +8,15 @@ from unittest.mock import patch
 import pytest
 
 from scripts.months import (
+    _html_uses_american_dates,
+    count_divergent_months,
+    count_html_messages,
+    count_nonempty_months,
     current_month_utc,
+    is_month_dir_name,
     month_bounds,
     month_range_iter,
+    scan_completed_months,
     snowflake_to_datetime,
     snowflake_to_month,
 )
@@ -134,8 +141,6 @@ def test_current_month_utc_format() -> None:
 
 def test_is_month_dir_name() -> None:
     """is_month_dir_name accepts YYYY-MM strings and rejects others."""
-    from scripts.months import is_month_dir_name
-
     assert is_month_dir_name("2026-05") is True
     assert is_month_dir_name("2025-12") is True
     assert is_month_dir_name("2026-01") is True
@@ -150,8 +155,6 @@ def test_is_month_dir_name() -> None:
 
 def test_scan_completed_months_finds_month_directories(tmp_path: Path) -> None:
     """scan_completed_months returns months that have a non-empty HTML file."""
-    from scripts.months import scan_completed_months
-
     channel_dir = tmp_path / "general"
     (channel_dir / "2026-01").mkdir(parents=True)
     (channel_dir / "2026-01" / "2026-01.html").write_text("<html>jan</html>")
@@ -171,8 +174,6 @@ def test_scan_completed_months_finds_month_directories(tmp_path: Path) -> None:
 
 def test_scan_completed_months_empty_when_dir_missing(tmp_path: Path) -> None:
     """A missing channel directory has no completed months."""
-    from scripts.months import scan_completed_months
-
     completed = scan_completed_months(tmp_path / "does-not-exist")
     assert completed == set()
 
@@ -185,16 +186,12 @@ def test_scan_completed_months_skips_cross_month_jsons(tmp_path: Path) -> None:
     holds messages timestamped 2025-04 through 2025-11. We must re-export
     those months properly, not skip them.
     """
-    import json as _json
-
-    from scripts.months import scan_completed_months
-
     channel_dir = tmp_path / "general"
     month_dir = channel_dir / "2025-11"
     month_dir.mkdir(parents=True)
     (month_dir / "2025-11.html").write_text("<html>mixed</html>")
     (month_dir / "2025-11.json").write_text(
-        _json.dumps(
+        json.dumps(
             {
                 "messages": [
                     {"id": "1", "timestamp": "2025-04-10T00:00:00+00:00"},
@@ -211,7 +208,7 @@ def test_scan_completed_months_skips_cross_month_jsons(tmp_path: Path) -> None:
     pure_month.mkdir()
     (pure_month / "2026-05.html").write_text("<html><div data-message-id=10>hi</div></html>")
     (pure_month / "2026-05.json").write_text(
-        _json.dumps({"messages": [{"id": "10", "timestamp": "2026-05-02T00:00:00+00:00"}]})
+        json.dumps({"messages": [{"id": "10", "timestamp": "2026-05-02T00:00:00+00:00"}]})
     )
 
     completed = scan_completed_months(channel_dir)
@@ -222,16 +219,12 @@ def test_scan_completed_months_skips_cross_month_jsons(tmp_path: Path) -> None:
 def test_scan_completed_months_excludes_divergent_month(tmp_path: Path) -> None:
     """A month whose JSON holds more messages than the HTML renders (issue #1
     divergence) is NOT complete, so it re-exports and heals."""
-    import json as _json
-
-    from scripts.months import scan_completed_months
-
     chan = tmp_path / "general"
     month = chan / "2026-04"
     month.mkdir(parents=True)
     # JSON says 3 messages; HTML renders only 1 → divergent.
     (month / "2026-04.json").write_text(
-        _json.dumps(
+        json.dumps(
             {
                 "messages": [
                     {"id": "1", "timestamp": "2026-04-01T00:00:00+00:00"},
@@ -249,8 +242,6 @@ def test_scan_completed_months_excludes_divergent_month(tmp_path: Path) -> None:
 def test_count_html_messages_counts_data_message_id(tmp_path: Path) -> None:
     """count_html_messages counts DCE's unquoted data-message-id= markers and
     ignores the chatlog__message-container- tokens in CSS/JS."""
-    from scripts.months import count_html_messages
-
     ids = ["111", "222"]
     html = tmp_path / "m.html"
     html.write_text(
@@ -262,18 +253,14 @@ def test_count_html_messages_counts_data_message_id(tmp_path: Path) -> None:
 
 def test_count_divergent_months(tmp_path: Path) -> None:
     """count_divergent_months counts months where JSON and HTML counts differ."""
-    import json as _json
-
-    from scripts.months import count_divergent_months
-
     chan = tmp_path / "general"
     ok = chan / "2026-05"
     ok.mkdir(parents=True)
-    (ok / "2026-05.json").write_text(_json.dumps({"messages": [{"id": "1"}]}))
+    (ok / "2026-05.json").write_text(json.dumps({"messages": [{"id": "1"}]}))
     (ok / "2026-05.html").write_text("<div data-message-id=1>x</div>")
     bad = chan / "2026-04"
     bad.mkdir()
-    (bad / "2026-04.json").write_text(_json.dumps({"messages": [{"id": "1"}, {"id": "2"}]}))
+    (bad / "2026-04.json").write_text(json.dumps({"messages": [{"id": "1"}, {"id": "2"}]}))
     (bad / "2026-04.html").write_text("<html>blank</html>")
 
     assert count_divergent_months(chan) == 1
@@ -281,15 +268,11 @@ def test_count_divergent_months(tmp_path: Path) -> None:
 
 def test_scan_completed_months_treats_empty_json_as_complete(tmp_path: Path) -> None:
     """An empty messages array is consistent with any month tag — count as done."""
-    import json as _json
-
-    from scripts.months import scan_completed_months
-
     channel_dir = tmp_path / "general"
     month_dir = channel_dir / "2026-03"
     month_dir.mkdir(parents=True)
     (month_dir / "2026-03.html").write_text("<html>empty</html>")
-    (month_dir / "2026-03.json").write_text(_json.dumps({"messages": []}))
+    (month_dir / "2026-03.json").write_text(json.dumps({"messages": []}))
 
     completed = scan_completed_months(channel_dir)
     assert completed == {"2026-03"}
@@ -300,8 +283,6 @@ def test_count_nonempty_months_uses_json_size(tmp_path: Path) -> None:
     DCE export (a cheap os.stat heuristic — empty 0-message JSON is ~500B,
     one with messages is multi-KB). Used to prioritize starved entries.
     """
-    from scripts.months import count_nonempty_months
-
     chan = tmp_path / "thread-a"
     # Empty current-month export: tiny JSON (DCE 0-message scaffold ~500B).
     (chan / "2026-05").mkdir(parents=True)
@@ -318,8 +299,6 @@ def test_count_nonempty_months_uses_json_size(tmp_path: Path) -> None:
 def test_count_nonempty_months_zero_for_only_empty(tmp_path: Path) -> None:
     """A thread that only has an empty current-month export counts as 0 —
     this is exactly the 'empty thread' case that must be prioritized."""
-    from scripts.months import count_nonempty_months
-
     chan = tmp_path / "starved-thread"
     (chan / "2026-05").mkdir(parents=True)
     (chan / "2026-05" / "2026-05.json").write_text('{"messages":[]}')
@@ -329,15 +308,11 @@ def test_count_nonempty_months_zero_for_only_empty(tmp_path: Path) -> None:
 
 def test_count_nonempty_months_missing_dir_is_zero(tmp_path: Path) -> None:
     """No public dir yet → zero non-empty months (maximally starved)."""
-    from scripts.months import count_nonempty_months
-
     assert count_nonempty_months(tmp_path / "nope") == 0
 
 
 def test_html_uses_american_dates(tmp_path: Path) -> None:
     """Detect the dominant date format: US MM/DD/YYYY vs ISO YYYY-MM-DD (#3)."""
-    from scripts.months import _html_uses_american_dates
-
     us = tmp_path / "us.html"
     us.write_text("After 04/30/2026 23:59 ... 05/01/2026 ... 05/02/2026")
     assert _html_uses_american_dates(us) is True
@@ -355,15 +330,11 @@ def test_html_uses_american_dates(tmp_path: Path) -> None:
 def test_scan_completed_excludes_american_date_month(tmp_path: Path) -> None:
     """A consistent month still rendered with American dates is incomplete, so
     it re-exports and converts to ISO (issue #3)."""
-    import json as _json
-
-    from scripts.months import scan_completed_months
-
     chan = tmp_path / "general"
     month = chan / "2026-05"
     month.mkdir(parents=True)
     (month / "2026-05.json").write_text(
-        _json.dumps({"messages": [{"id": "1", "timestamp": "2026-05-02T00:00:00+00:00"}]})
+        json.dumps({"messages": [{"id": "1", "timestamp": "2026-05-02T00:00:00+00:00"}]})
     )
     # HTML is consistent (1 rendered message) but American-style dates.
     (month / "2026-05.html").write_text(
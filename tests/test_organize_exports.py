@@ -1,74 +1,162 @@
 # tests/test_organize_exports.py
-import tempfile
+import filecmp
+import json
+import os
+import shutil
+import stat
 from pathlib import Path
 
 import pytest
 
 from scripts.organize_exports import cleanup_exports, organize_exports
 
-# Test constants
-EXPECTED_FILES_ORGANIZED = 4
-EXPECTED_SERVERS_PROCESSED = 3
 
+@pytest.fixture
+def export_dirs(tmp_path: Path) -> tuple[Path, Path]:
+    """`(exports, public)` roots under this test's `tmp_path`; neither is created."""
+    return tmp_path / "exports", tmp_path / "public"
 
-def test_organize_exports_creates_month_directory_from_filename() -> None:
+
+@pytest.fixture(scope="session")
+def export_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only exports tree with one channel holding `2026-05.html`.
+
+    Built once per session; tests `shutil.copytree` it into their own
+    `exports` root rather than re-creating the scaffold file by file.
+    """
+    root = tmp_path_factory.mktemp("tpl")
+    _seed(root / "test-server" / "general", {"2026-05.html": b"<html>may</html>"})
+    return root
+
+
+def _seed(directory: Path, files: dict[str, bytes]) -> None:
+    """Create `directory` and write each `name -> bytes` entry into it.
+
+    Writes go straight through `os.open`/`os.write`, skipping the buffered
+    text layer (and str→bytes encode) that `Path.write_text` would add to
+    every fixture file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name, data in files.items():
+        fd = os.open(directory / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+
+def _entries(directory: Path) -> dict[str, os.DirEntry[str]]:
+    """`directory`'s children by name; each DirEntry caches its file type."""
+    with os.scandir(directory) as entries:
+        return {entry.name: entry for entry in entries}
+
+
+def _names(directory: Path) -> set[str]:
+    """Names of `directory`'s direct children, from a single `os.scandir` pass."""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+
+# (exports seeds keyed by channel dir, expected published names keyed by month dir)
+LAYOUT_CASES = [
+    pytest.param(
+        {
+            "test-server/general": {
+                "2026-05.html": b"<html>may</html>",
+                "2026-05.txt": b"may messages",
+                "2026-05.json": b'{"messages":[{"id":"1"}]}',
+                "2026-05.csv": b"id\n1\n",
+            }
+        },
+        {
+            "test-server/general/2026-05": {
+                "2026-05.html",
+                "2026-05.txt",
+                "2026-05.json",
+                "2026-05.csv",
+            }
+        },
+        id="all-formats-one-month",
+    ),
+    pytest.param(
+        {
+            "test-server/general": {
+                "2026-03.html": b"<html>march</html>",
+                "2026-04.html": b"<html>april</html>",
+                "2026-05.html": b"<html>may</html>",
+            }
+        },
+        {
+            "test-server/general/2026-03": {"2026-03.html"},
+            "test-server/general/2026-04": {"2026-04.html"},
+            "test-server/general/2026-05": {"2026-05.html"},
+        },
+        id="one-directory-per-filename-month",
+    ),
+    pytest.param(
+        {
+            "test-server/questions/how-to-start": {
+                "2026-05.html": b"<html>thread may</html>",
+                "2026-05.json": b'{"messages": []}',
+            },
+            "test-server/questions/help-needed": {"2026-04.html": b"<html>thread april</html>"},
+        },
+        {
+            "test-server/questions/how-to-start/2026-05": {"2026-05.html", "2026-05.json"},
+            "test-server/questions/help-needed/2026-04": {"2026-04.html"},
+        },
+        id="forum-threads",
+    ),
+    pytest.param(
+        {
+            "server-one/general": {"2026-05.html": b"s1 general"},
+            "server-one/announcements": {"2026-05.html": b"s1 ann"},
+            "server-two/general": {"2026-05.html": b"s2 general"},
+        },
+        {
+            "server-one/general/2026-05": {"2026-05.html"},
+            "server-one/announcements/2026-05": {"2026-05.html"},
+            "server-two/general/2026-05": {"2026-05.html"},
+        },
+        id="multiple-servers",
+    ),
+]
+
+
+@pytest.mark.parametrize(("seeds", "expected"), LAYOUT_CASES)
+def test_organize_exports_places_files_by_filename_month(
+    export_dirs: tuple[Path, Path],
+    seeds: dict[str, dict[str, bytes]],
+    expected: dict[str, set[str]],
+) -> None:
     """Per-month input `2026-05.html` lands at `public/server/channel/2026-05/2026-05.html`.
 
     The month comes from the filename, NOT from datetime.now() — that's
     the entire point of the refactor. Otherwise a backfilled 2026-03
-    export would be misfiled into the current calendar month.
+    export would be misfiled into the current calendar month. Threads
+    inside a forum directory, and channels across several servers, get the
+    same per-month treatment.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
-
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        (channel_dir / "2026-05.html").write_text("<html>may</html>")
-        (channel_dir / "2026-05.txt").write_text("may messages")
-        (channel_dir / "2026-05.json").write_text('{"messages":[{"id":"1"}]}')
-        (channel_dir / "2026-05.csv").write_text("id\n1\n")
-
-        stats = organize_exports(exports, public)
-
-        assert stats["files_organized"] == EXPECTED_FILES_ORGANIZED
-        assert stats["channels_processed"] == 1
-        assert len(stats["errors"]) == 0
-
-        target = public / "test-server" / "general" / "2026-05"
-        assert (target / "2026-05.html").exists()
-        assert (target / "2026-05.txt").exists()
-        assert (target / "2026-05.json").exists()
-        assert (target / "2026-05.csv").exists()
-
-
-def test_organize_exports_partitions_by_each_filename_month() -> None:
-    """Multiple per-month files for one channel land in their own directories."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
-
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        (channel_dir / "2026-03.html").write_text("<html>march</html>")
-        (channel_dir / "2026-04.html").write_text("<html>april</html>")
-        (channel_dir / "2026-05.html").write_text("<html>may</html>")
+    exports, public = export_dirs
 
-        organize_exports(exports, public)
+    for channel, files in seeds.items():
+        _seed(exports / channel, files)
+
+    stats = organize_exports(exports, public)
 
-        assert (public / "test-server" / "general" / "2026-03" / "2026-03.html").exists()
-        assert (public / "test-server" / "general" / "2026-04" / "2026-04.html").exists()
-        assert (public / "test-server" / "general" / "2026-05" / "2026-05.html").exists()
-        # And no cross-contamination
-        march = (public / "test-server" / "general" / "2026-03" / "2026-03.html").read_text()
-        assert "march" in march
-        assert "april" not in march
-        assert "may" not in march
+    assert stats["files_organized"] == sum(len(names) for names in expected.values())
+    assert stats["channels_processed"] == len(seeds)
+    assert len(stats["errors"]) == 0
 
+    for month_dir, names in expected.items():
+        assert _names(public / month_dir) == names
+        # No cross-contamination: each month holds its own export's bytes
+        source = seeds[str(Path(month_dir).parent)]
+        for name in names:
+            assert (public / month_dir / name).read_bytes() == source[name]
 
-def test_latest_html_is_redirect_not_symlink() -> None:
+
+def test_latest_html_is_redirect_not_symlink(export_dirs: tuple[Path, Path]) -> None:
     """`latest.html` must be a real HTML redirect, not a symlink/flat copy.
 
     The deploy action (peaceiris) dereferences symlinks into flat file
@@ -79,265 +167,341 @@ def test_latest_html_is_redirect_not_symlink() -> None:
     this: the browser navigates to the real per-month URL first, so
     relative asset paths resolve correctly.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
-
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        (channel_dir / "2026-03.html").write_text("<html>march</html>")
-        (channel_dir / "2026-05.html").write_text("<html>may</html>")
-
-        organize_exports(exports, public)
-
-        latest_html = public / "test-server" / "general" / "latest.html"
-        assert latest_html.exists()
-        # Must NOT be a symlink (peaceiris would flatten it and break media)
-        assert not latest_html.is_symlink()
-        content = latest_html.read_text()
-        # Points at the newest month's real page via meta refresh
-        assert "2026-05/2026-05.html" in content
-        assert "http-equiv" in content.lower()
-        assert "refresh" in content.lower()
-        # Sanity: it does NOT inline the month's body (which would carry
-        # the broken relative media paths)
-        assert "<html>may</html>" not in content
-
-
-def test_latest_data_files_remain_symlinks() -> None:
+    exports, public = export_dirs
+
+    channel_dir = exports / "test-server" / "general"
+    _seed(
+        channel_dir,
+        {"2026-03.html": b"<html>march</html>", "2026-05.html": b"<html>may</html>"},
+    )
+
+    organize_exports(exports, public)
+
+    latest_html = public / "test-server" / "general" / "latest.html"
+    # One lstat proves it exists AND is a regular file, not a symlink
+    # (peaceiris would flatten a symlink and break media)
+    assert stat.S_ISREG(os.lstat(latest_html).st_mode)
+    content = latest_html.read_text()
+    # Points at the newest month's real page via meta refresh
+    assert "2026-05/2026-05.html" in content
+    assert "http-equiv" in content.lower()
+    assert "refresh" in content.lower()
+    # Sanity: it does NOT inline the month's body (which would carry
+    # the broken relative media paths)
+    assert "<html>may</html>" not in content
+
+
+def test_latest_data_files_remain_symlinks(export_dirs: tuple[Path, Path]) -> None:
     """latest.txt/json/csv stay symlinks — they have no relative asset refs.
 
     Plain data formats are self-contained, so a flat copy (what the deploy
     produces from a symlink) is correct for them; only HTML needs the
     redirect treatment.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
-
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        (channel_dir / "2026-05.html").write_text("<html>may</html>")
-        (channel_dir / "2026-05.txt").write_text("may text")
-        (channel_dir / "2026-05.json").write_text('{"messages":[]}')
-        (channel_dir / "2026-05.csv").write_text("id\n1\n")
-
-        organize_exports(exports, public)
-
-        base = public / "test-server" / "general"
-        for ext in ("txt", "json", "csv"):
-            link = base / f"latest.{ext}"
-            assert link.is_symlink(), f"latest.{ext} should be a symlink"
-            assert link.readlink() == Path(f"2026-05/2026-05.{ext}")
-
-
-def test_organize_exports_multiple_servers() -> None:
-    """Test organizing exports from multiple servers"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
-
-        # Server 1 with two channels
-        (exports / "server-one" / "general").mkdir(parents=True)
-        (exports / "server-one" / "general" / "2026-05.html").write_text("s1 general")
-        (exports / "server-one" / "announcements").mkdir(parents=True)
-        (exports / "server-one" / "announcements" / "2026-05.html").write_text("s1 ann")
+    exports, public = export_dirs
+
+    channel_dir = exports / "test-server" / "general"
+    _seed(
+        channel_dir,
+        {
+            "2026-05.html": b"<html>may</html>",
+            "2026-05.txt": b"may text",
+            "2026-05.json": b'{"messages":[]}',
+            "2026-05.csv": b"id\n1\n",
+        },
+    )
+
+    organize_exports(exports, public)
+
+    base = public / "test-server" / "general"
+    for ext in ("txt", "json", "csv"):
+        link = base / f"latest.{ext}"
+        assert stat.S_ISLNK(os.lstat(link).st_mode), f"latest.{ext} should be a symlink"
+        assert os.readlink(link) == f"2026-05/2026-05.{ext}"
+
+
+def test_organize_exports_replaces_existing_latest_pointers(
+    export_dirs: tuple[Path, Path],
+) -> None:
+    """Stale `latest.*` from an older month are repointed at the newest month.
+
+    Includes a legacy `latest.html` *symlink*, which must be swapped for a
+    real redirect file rather than followed and overwritten in place.
+    """
+    exports, public = export_dirs
 
-        # Server 2 with one channel
-        (exports / "server-two" / "general").mkdir(parents=True)
-        (exports / "server-two" / "general" / "2026-05.html").write_text("s2 general")
+    published = public / "test-server" / "general"
+    _seed(
+        published / "2026-03",
+        {"2026-03.html": b"<html>march</html>", "2026-03.json": b'{"messages":[]}'},
+    )
+    os.symlink("2026-03/2026-03.html", published / "latest.html")
+    os.symlink("2026-03/2026-03.json", published / "latest.json")
 
-        stats = organize_exports(exports, public)
+    _seed(
+        exports / "test-server" / "general",
+        {"2026-05.html": b"<html>may</html>", "2026-05.json": b'{"messages":[]}'},
+    )
 
-        assert stats["files_organized"] == EXPECTED_SERVERS_PROCESSED
-        assert stats["channels_processed"] == EXPECTED_SERVERS_PROCESSED
+    organize_exports(exports, public)
 
-        assert (public / "server-one").exists()
-        assert (public / "server-two").exists()
+    assert os.readlink(published / "latest.json") == "2026-05/2026-05.json"
+    assert stat.S_ISREG(os.lstat(published / "latest.html").st_mode)
+    assert "2026-05/2026-05.html" in (published / "latest.html").read_text()
+    # The old month's page was not clobbered through the stale symlink
+    assert (published / "2026-03" / "2026-03.html").read_bytes() == b"<html>march</html>"
 
 
-def test_organize_exports_handles_missing_exports_dir() -> None:
+def test_organize_exports_handles_missing_exports_dir(export_dirs: tuple[Path, Path]) -> None:
     """Test that organize_exports raises error if exports dir missing"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
+    exports, public = export_dirs
 
-        # Don't create exports directory
-        with pytest.raises(FileNotFoundError, match="Exports directory not found"):
-            organize_exports(exports, public)
+    # Don't create exports directory
+    with pytest.raises(FileNotFoundError, match="Exports directory not found"):
+        organize_exports(exports, public)
 
 
-def test_organize_exports_creates_public_dir_if_missing() -> None:
+def test_organize_exports_creates_public_dir_if_missing(
+    export_dirs: tuple[Path, Path], export_template: Path
+) -> None:
     """Test that organize_exports creates public dir if it doesn't exist"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
+    exports, public = export_dirs
 
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        (channel_dir / "2026-05.html").write_text("test")
+    shutil.copytree(export_template, exports)
 
-        # Organize should create public directory
-        organize_exports(exports, public)
+    # Organize should create public directory
+    organize_exports(exports, public)
 
-        assert public.exists()
-        assert public.is_dir()
+    assert stat.S_ISDIR(os.stat(public).st_mode)
 
 
-def test_organize_exports_skips_invalid_extensions() -> None:
+def test_organize_exports_skips_invalid_extensions(
+    export_dirs: tuple[Path, Path], export_template: Path
+) -> None:
     """Test that organize_exports skips files with invalid extensions"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
+    exports, public = export_dirs
 
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        (channel_dir / "2026-05.html").write_text("valid")
-        (channel_dir / "2026-05.pdf").write_text("invalid")
-        (channel_dir / "notes.md").write_text("invalid")
+    shutil.copytree(export_template, exports)
+    _seed(
+        exports / "test-server" / "general",
+        {"2026-05.pdf": b"invalid", "notes.md": b"invalid"},
+    )
 
-        stats = organize_exports(exports, public)
+    stats = organize_exports(exports, public)
 
-        # Only the html file should organize
-        assert stats["files_organized"] == 1
-        assert stats["channels_processed"] == 1
+    # Only the html file should organize
+    assert stats["files_organized"] == 1
+    assert stats["channels_processed"] == 1
 
 
-def test_organize_exports_skips_non_month_filenames() -> None:
+def test_organize_exports_skips_non_month_filenames(
+    export_dirs: tuple[Path, Path], export_template: Path
+) -> None:
     """Files that aren't named YYYY-MM.{ext} are ignored.
 
     This guards against accidentally treating an arbitrary filename as a
     month, which would create confusing directories like `latest/` if a
     leftover symlink or stray file landed in the channel directory.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
+    exports, public = export_dirs
 
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        (channel_dir / "2026-05.html").write_text("ok")
-        (channel_dir / "general.html").write_text("wrong format")
-        (channel_dir / "latest.html").write_text("wrong format")
+    shutil.copytree(export_template, exports)
+    _seed(
+        exports / "test-server" / "general",
+        {"general.html": b"wrong format", "latest.html": b"wrong format"},
+    )
 
-        stats = organize_exports(exports, public)
+    stats = organize_exports(exports, public)
 
-        assert stats["files_organized"] == 1
-        # Only 2026-05 directory should exist
-        assert (public / "test-server" / "general" / "2026-05").exists()
-        assert not (public / "test-server" / "general" / "general").exists()
-        assert not (public / "test-server" / "general" / "latest").exists()
+    assert stats["files_organized"] == 1
+    # Only 2026-05 directory should exist
+    entries = _entries(public / "test-server" / "general")
+    assert entries["2026-05"].is_dir()
+    assert "general" not in entries
+    assert "latest" not in entries
 
 
-def test_cleanup_exports_removes_organized_files() -> None:
-    """Test that cleanup_exports removes per-month files from exports directory"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
+def test_organize_exports_reports_copy_errors(
+    export_dirs: tuple[Path, Path], export_template: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed copy is recorded in `stats["errors"]` instead of aborting the run."""
 
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        file1 = channel_dir / "2026-05.html"
-        file2 = channel_dir / "2026-05.json"
-        file1.write_text("test1")
-        file2.write_text("test2")
+    def fail_copy(src: Path, dst: Path) -> None:
+        raise OSError("disk full")
 
-        cleanup_exports(exports)
+    exports, public = export_dirs
+    # Copy the scaffold before patching: the patch swaps the global `shutil.copy2`
+    shutil.copytree(export_template, exports)
+    monkeypatch.setattr("scripts.organize_exports.shutil.copy2", fail_copy)
 
-        assert not file1.exists()
-        assert not file2.exists()
+    stats = organize_exports(exports, public)
 
+    assert stats["files_organized"] == 0
+    assert len(stats["errors"]) == 1
+    assert "Failed to copy" in stats["errors"][0]
 
-def test_cleanup_exports_handles_missing_dir() -> None:
-    """Test that cleanup_exports handles missing directory gracefully"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
 
-        # Don't create directory
-        # Should not raise error
-        cleanup_exports(exports)
+def test_cleanup_exports_removes_organized_files(tmp_path: Path) -> None:
+    """Test that cleanup_exports removes per-month files from exports directory"""
+    exports = tmp_path / "exports"
 
+    channel_dir = exports / "test-server" / "general"
+    _seed(channel_dir, {"2026-05.html": b"test1", "2026-05.json": b"test2"})
 
-def test_organize_exports_handles_forum_threads() -> None:
-    """Threads inside a forum directory get per-month organization."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
+    cleanup_exports(exports)
 
-        # exports/test-server/questions/how-to-start/2026-05.html
-        thread_dir = exports / "test-server" / "questions" / "how-to-start"
-        thread_dir.mkdir(parents=True)
-        (thread_dir / "2026-05.html").write_text("<html>thread may</html>")
-        (thread_dir / "2026-05.json").write_text('{"messages": []}')
+    # Files are gone but the directory survives for the next export run
+    assert _names(channel_dir) == set()
 
-        # Another thread in same forum
-        thread2 = exports / "test-server" / "questions" / "help-needed"
-        thread2.mkdir(parents=True)
-        (thread2 / "2026-04.html").write_text("<html>thread april</html>")
 
-        organize_exports(exports, public)
+def test_cleanup_exports_handles_missing_dir(tmp_path: Path) -> None:
+    """Test that cleanup_exports handles missing directory gracefully"""
+    exports = tmp_path / "exports"
 
-        assert (
-            public / "test-server" / "questions" / "how-to-start" / "2026-05" / "2026-05.html"
-        ).exists()
-        assert (
-            public / "test-server" / "questions" / "help-needed" / "2026-04" / "2026-04.html"
-        ).exists()
+    # Don't create directory
+    # Should not raise error
+    cleanup_exports(exports)
 
 
-def test_organize_exports_copies_per_month_media_directory() -> None:
+def test_organize_exports_copies_per_month_media_directory(
+    export_dirs: tuple[Path, Path], export_template: Path
+) -> None:
     """Per-month media dir `2026-05_media/` lands inside `2026-05/`."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
-
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        (channel_dir / "2026-05.html").write_text("<html>content</html>")
-        media_dir = channel_dir / "2026-05_media"
-        media_dir.mkdir()
-        (media_dir / "avatar.png").write_bytes(b"png-bytes")
-        (media_dir / "doc.pdf").write_bytes(b"pdf-bytes")
-
-        organize_exports(exports, public)
+    exports, public = export_dirs
 
-        public_media = public / "test-server" / "general" / "2026-05" / "2026-05_media"
-        assert public_media.is_dir()
-        assert (public_media / "avatar.png").read_bytes() == b"png-bytes"
-        assert (public_media / "doc.pdf").read_bytes() == b"pdf-bytes"
+    shutil.copytree(export_template, exports)
+    channel_dir = exports / "test-server" / "general"
+    media_dir = channel_dir / "2026-05_media"
+    _seed(media_dir, {"avatar.png": b"png-bytes", "doc.pdf": b"pdf-bytes"})
 
+    organize_exports(exports, public)
 
-def test_organize_exports_handles_missing_media_directory() -> None:
-    """Channel without media still organizes cleanly."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
-
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        (channel_dir / "2026-05.html").write_text("<html>no media</html>")
+    public_media = public / "test-server" / "general" / "2026-05" / "2026-05_media"
+    # Same names as the source, and byte-identical contents (compared in
+    # blocks by filecmp rather than loading both copies into memory)
+    names = _names(media_dir)
+    assert _names(public_media) == names
+    match, mismatch, errors = filecmp.cmpfiles(media_dir, public_media, names, shallow=False)
+    assert (mismatch, errors) == ([], [])
+    assert set(match) == names
 
-        stats = organize_exports(exports, public)
-        assert stats["files_organized"] == 1
-        assert len(stats["errors"]) == 0
 
-        public_chan = public / "test-server" / "general" / "2026-05"
-        assert public_chan.exists()
-        assert not (public_chan / "2026-05_media").exists()
+def test_organize_exports_preserves_file_metadata(
+    export_dirs: tuple[Path, Path], export_template: Path
+) -> None:
+    """Published files keep the export's mtime (organize copies with `copy2`).
 
-
-def test_organize_exports_strips_cross_month_messages_during_merge() -> None:
+    Each side is one `os.scandir` pass; the DirEntry stats come from the
+    enumeration itself, so no file is stat'ed twice.
+    """
+    exports, public = export_dirs
+
+    shutil.copytree(export_template, exports)
+    channel_dir = exports / "test-server" / "general"
+    _seed(channel_dir, {"2026-05.json": b'{"messages":[]}', "2026-05.txt": b"may"})
+    # Backdate the exports so a fresh mtime on a copy can't pass by accident
+    for name in ("2026-05.html", "2026-05.json", "2026-05.txt"):
+        os.utime(channel_dir / name, (1_700_000_000, 1_700_000_000))
+
+    organize_exports(exports, public)
+
+    month_dir = public / "test-server" / "general" / "2026-05"
+    with os.scandir(channel_dir) as entries:
+        originals = {e.name: e.stat(follow_symlinks=False) for e in entries if e.is_file()}
+    with os.scandir(month_dir) as entries:
+        copies = {e.name: e.stat(follow_symlinks=False) for e in entries}
+    assert copies.keys() == originals.keys()
+    for name, original in originals.items():
+        assert abs(copies[name].st_mtime - original.st_mtime) < 1, name
+
+
+def test_organize_exports_handles_missing_media_directory(
+    export_dirs: tuple[Path, Path], export_template: Path
+) -> None:
+    """Channel without media still organizes cleanly."""
+    exports, public = export_dirs
+
+    shutil.copytree(export_template, exports)
+
+    stats = organize_exports(exports, public)
+    assert stats["files_organized"] == 1
+    assert len(stats["errors"]) == 0
+
+    # Just the page; no empty `2026-05_media/` conjured up
+    assert _names(public / "test-server" / "general" / "2026-05") == {"2026-05.html"}
+
+
+# Merge-test JSON fixtures, serialized once at import rather than per test.
+
+# Legacy 2025-11.json with messages from multiple months
+LEGACY_MIXED_NOV_JSON = json.dumps(
+    {
+        "guild": {"id": "1"},
+        "channel": {"id": "2"},
+        "messages": [
+            {"id": "100", "content": "april", "timestamp": "2025-04-15T00:00:00+00:00"},
+            {"id": "200", "content": "may", "timestamp": "2025-05-15T00:00:00+00:00"},
+            {"id": "300", "content": "nov", "timestamp": "2025-11-15T00:00:00+00:00"},
+        ],
+        "messageCount": 3,
+    }
+).encode()
+
+# New honest export of November
+NOV_REEXPORT_JSON = json.dumps(
+    {
+        "guild": {"id": "1"},
+        "channel": {"id": "2"},
+        "messages": [
+            {"id": "300", "content": "nov (edited)", "timestamp": "2025-11-15T00:00:00+00:00"},
+            {"id": "400", "content": "nov-2", "timestamp": "2025-11-20T00:00:00+00:00"},
+        ],
+        "messageCount": 2,
+    }
+).encode()
+
+PUBLISHED_MAY_JSON = json.dumps(
+    {
+        "guild": {"id": "123"},
+        "channel": {"id": "456", "name": "general"},
+        "messages": [
+            {"id": "1000", "content": "First", "timestamp": "2026-05-01T00:00:00"},
+            {"id": "1001", "content": "Second", "timestamp": "2026-05-02T00:00:00"},
+        ],
+        "messageCount": 2,
+    }
+).encode()
+
+# Re-export of PUBLISHED_MAY_JSON: 1000 edited, 1001 gone (deleted), 1002 added.
+MAY_REEXPORT_JSON = json.dumps(
+    {
+        "guild": {"id": "123"},
+        "channel": {"id": "456", "name": "general"},
+        "messages": [
+            {"id": "1000", "content": "First (edited)", "timestamp": "2026-05-01T00:00:00"},
+            {"id": "1002", "content": "Third", "timestamp": "2026-05-03T00:00:00"},
+        ],
+        "messageCount": 2,
+    }
+).encode()
+
+NONEMPTY_MAY_JSON = json.dumps(
+    {
+        "channel": {"id": "456"},
+        "messages": [
+            {"id": "1000", "content": "kept", "timestamp": "2026-05-01T00:00:00"},
+            {"id": "1001", "content": "kept2", "timestamp": "2026-05-02T00:00:00"},
+        ],
+        "messageCount": 2,
+    }
+).encode()
+
+EMPTY_MAY_JSON = json.dumps({"channel": {"id": "456"}, "messages": [], "messageCount": 0}).encode()
+
+
+def test_organize_exports_strips_cross_month_messages_during_merge(
+    export_dirs: tuple[Path, Path],
+) -> None:
     """When merging into a legacy mixed-month JSON, prune out other months.
 
     The legacy `2025-11.json` contained messages from 2025-04 through
@@ -345,142 +509,77 @@ def test_organize_exports_strips_cross_month_messages_during_merge() -> None:
     November messages — merging unchanged would propagate the legacy
     contamination. We must drop the non-November entries during merge.
     """
-    import json
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
-
-        # Legacy: 2025-11.json with messages from multiple months
-        existing_dir = public / "test-server" / "general" / "2025-11"
-        existing_dir.mkdir(parents=True)
-        legacy_json = {
-            "guild": {"id": "1"},
-            "channel": {"id": "2"},
-            "messages": [
-                {"id": "100", "content": "april", "timestamp": "2025-04-15T00:00:00+00:00"},
-                {"id": "200", "content": "may", "timestamp": "2025-05-15T00:00:00+00:00"},
-                {"id": "300", "content": "nov", "timestamp": "2025-11-15T00:00:00+00:00"},
-            ],
-            "messageCount": 3,
-        }
-        (existing_dir / "2025-11.json").write_text(json.dumps(legacy_json))
-
-        # New honest export of November
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        new_json = {
-            "guild": {"id": "1"},
-            "channel": {"id": "2"},
-            "messages": [
-                {"id": "300", "content": "nov (edited)", "timestamp": "2025-11-15T00:00:00+00:00"},
-                {"id": "400", "content": "nov-2", "timestamp": "2025-11-20T00:00:00+00:00"},
-            ],
-            "messageCount": 2,
-        }
-        (channel_dir / "2025-11.json").write_text(json.dumps(new_json))
-        (channel_dir / "2025-11.html").write_text("<html>nov</html>")
-
-        organize_exports(exports, public)
-
-        merged = json.loads((existing_dir / "2025-11.json").read_text())
-        ids = [m["id"] for m in merged["messages"]]
-        # April and May messages purged; November messages retained;
-        # the edit on id=300 wins.
-        assert "100" not in ids
-        assert "200" not in ids
-        assert ids == ["300", "400"]
-        msg_300 = next(m for m in merged["messages"] if m["id"] == "300")
-        assert msg_300["content"] == "nov (edited)"
-
-
-def test_organize_latest_export_is_authoritative_and_drops_deleted() -> None:
+    exports, public = export_dirs
+
+    existing_dir = public / "test-server" / "general" / "2025-11"
+    _seed(existing_dir, {"2025-11.json": LEGACY_MIXED_NOV_JSON})
+    _seed(
+        exports / "test-server" / "general",
+        {"2025-11.json": NOV_REEXPORT_JSON, "2025-11.html": b"<html>nov</html>"},
+    )
+
+    organize_exports(exports, public)
+
+    merged = json.loads((existing_dir / "2025-11.json").read_bytes())
+    ids = [m["id"] for m in merged["messages"]]
+    # April and May messages purged; November messages retained;
+    # the edit on id=300 wins.
+    assert "100" not in ids
+    assert "200" not in ids
+    assert ids == ["300", "400"]
+    msg_300 = next(m for m in merged["messages"] if m["id"] == "300")
+    assert msg_300["content"] == "nov (edited)"
+
+
+def test_organize_latest_export_is_authoritative_and_drops_deleted(
+    export_dirs: tuple[Path, Path],
+) -> None:
     """The latest successful export is authoritative: a message present in the
     published archive but ABSENT from the new export is dropped (deleted on
     Discord). This keeps the JSON consistent with the rendered HTML (issue #1);
     the old by-ID union preserved deleted messages and desynced the count."""
-    import json
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
-
-        existing_dir = public / "test-server" / "general" / "2026-05"
-        existing_dir.mkdir(parents=True)
-        existing_json = {
-            "guild": {"id": "123"},
-            "channel": {"id": "456", "name": "general"},
-            "messages": [
-                {"id": "1000", "content": "First", "timestamp": "2026-05-01T00:00:00"},
-                {"id": "1001", "content": "Second", "timestamp": "2026-05-02T00:00:00"},
-            ],
-            "messageCount": 2,
-        }
-        (existing_dir / "2026-05.json").write_text(json.dumps(existing_json))
-
-        # New per-month export: 1000 edited, 1001 gone (deleted), 1002 added.
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        new_json = {
-            "guild": {"id": "123"},
-            "channel": {"id": "456", "name": "general"},
-            "messages": [
-                {"id": "1000", "content": "First (edited)", "timestamp": "2026-05-01T00:00:00"},
-                {"id": "1002", "content": "Third", "timestamp": "2026-05-03T00:00:00"},
-            ],
-            "messageCount": 2,
-        }
-        (channel_dir / "2026-05.json").write_text(json.dumps(new_json))
-        (channel_dir / "2026-05.html").write_text("<html>updated</html>")
+    exports, public = export_dirs
 
-        organize_exports(exports, public)
+    existing_dir = public / "test-server" / "general" / "2026-05"
+    _seed(existing_dir, {"2026-05.json": PUBLISHED_MAY_JSON})
+    _seed(
+        exports / "test-server" / "general",
+        {"2026-05.json": MAY_REEXPORT_JSON, "2026-05.html": b"<html>updated</html>"},
+    )
+
+    organize_exports(exports, public)
 
-        result = json.loads((existing_dir / "2026-05.json").read_text())
-        ids = [m["id"] for m in result["messages"]]
-        # 1001 absent from the new export is dropped; no preservation.
-        assert ids == ["1000", "1002"]
-        msg_1000 = next(m for m in result["messages"] if m["id"] == "1000")
-        assert msg_1000["content"] == "First (edited)"
+    result = json.loads((existing_dir / "2026-05.json").read_bytes())
+    ids = [m["id"] for m in result["messages"]]
+    # 1001 absent from the new export is dropped; no preservation.
+    assert ids == ["1000", "1002"]
+    msg_1000 = next(m for m in result["messages"] if m["id"] == "1000")
+    assert msg_1000["content"] == "First (edited)"
 
 
-def test_organize_transient_empty_keeps_nonempty_month() -> None:
+def test_organize_transient_empty_keeps_nonempty_month(export_dirs: tuple[Path, Path]) -> None:
     """A non-empty published month re-exporting to EMPTY is treated as a
     transient/partial fetch: the existing export is kept and an error surfaced,
     rather than blanking the page (issue #1 transient guard)."""
-    import json
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        exports = tmpdir_path / "exports"
-        public = tmpdir_path / "public"
-
-        existing_dir = public / "test-server" / "general" / "2026-05"
-        existing_dir.mkdir(parents=True)
-        existing_json = {
-            "channel": {"id": "456"},
-            "messages": [
-                {"id": "1000", "content": "kept", "timestamp": "2026-05-01T00:00:00"},
-                {"id": "1001", "content": "kept2", "timestamp": "2026-05-02T00:00:00"},
-            ],
-            "messageCount": 2,
-        }
-        (existing_dir / "2026-05.json").write_text(json.dumps(existing_json))
-        (existing_dir / "2026-05.html").write_text("<html>real content</html>")
-
-        # New export of the same month is EMPTY (a transient/partial fetch).
-        channel_dir = exports / "test-server" / "general"
-        channel_dir.mkdir(parents=True)
-        empty_json = {"channel": {"id": "456"}, "messages": [], "messageCount": 0}
-        (channel_dir / "2026-05.json").write_text(json.dumps(empty_json))
-        (channel_dir / "2026-05.html").write_text("<html>empty</html>")
-
-        stats = organize_exports(exports, public)
-
-        # Existing JSON and HTML are untouched (not blanked).
-        result = json.loads((existing_dir / "2026-05.json").read_text())
-        assert [m["id"] for m in result["messages"]] == ["1000", "1001"]
-        assert (existing_dir / "2026-05.html").read_text() == "<html>real content</html>"
-        # And the regression is surfaced as an error.
-        assert any("transient" in e for e in stats["errors"])
+    exports, public = export_dirs
+
+    existing_dir = public / "test-server" / "general" / "2026-05"
+    _seed(
+        existing_dir,
+        {"2026-05.json": NONEMPTY_MAY_JSON, "2026-05.html": b"<html>real content</html>"},
+    )
+
+    # New export of the same month is EMPTY (a transient/partial fetch).
+    _seed(
+        exports / "test-server" / "general",
+        {"2026-05.json": EMPTY_MAY_JSON, "2026-05.html": b"<html>empty</html>"},
+    )
+
+    stats = organize_exports(exports, public)
+
+    # Existing JSON and HTML are untouched (not blanked).
+    result = json.loads((existing_dir / "2026-05.json").read_bytes())
+    assert [m["id"] for m in result["messages"]] == ["1000", "1001"]
+    assert (existing_dir / "2026-05.html").read_text() == "<html>real content</html>"
+    # And the regression is surfaced as an error.
+    assert any("transient" in e for e in stats["errors"])
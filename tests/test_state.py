@@ -1,53 +1,54 @@
+import itertools
 import json
-import tempfile
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from scripts.state import StateManager, ThreadInfo
 
+# make_manager(initial=None) -> (manager, state_file)
+ManagerFactory = Callable[..., tuple[StateManager, Path]]
 
-def test_state_manager_creates_empty_state() -> None:
-    """Test that StateManager creates empty state if file doesn't exist"""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        state_path = f.name
 
-    Path(state_path).unlink()  # Remove it
+@pytest.fixture
+def make_manager(tmp_path: Path) -> ManagerFactory:
+    """Factory for unloaded `StateManager`s, each over its own file in `tmp_path`.
 
-    manager = StateManager(state_path)
-    state = manager.load()
+    Call it with an initial state dict to write that file first, or with no
+    argument to leave the file missing.
+    """
+    counter = itertools.count()
 
-    assert state == {}
-    # Only unlink if it still exists (it shouldn't after empty state creation)
-    if Path(state_path).exists():
-        Path(state_path).unlink()
+    def factory(initial: dict[str, Any] | None = None) -> tuple[StateManager, Path]:
+        state_file = tmp_path / f"state-{next(counter)}.json"
+        if initial is not None:
+            state_file.write_text(json.dumps(initial))
+        return StateManager(str(state_file)), state_file
 
+    return factory
 
-def test_state_manager_loads_existing_state() -> None:
-    """Test that StateManager loads existing state"""
-    initial_state = {
-        "wafer-space": {
-            "general": {"last_export": "2025-01-15T14:00:00Z", "last_message_id": "123456"}
-        }
-    }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(initial_state, f)
-        state_path = f.name
+@pytest.fixture
+def state_manager(make_manager: ManagerFactory) -> tuple[StateManager, Path]:
+    """A loaded `StateManager` over an empty `{}` state file, plus that file's path."""
+    manager, state_file = make_manager({})
+    manager.load()
+    return manager, state_file
+
 
-    manager = StateManager(state_path)
+def test_state_manager_creates_empty_state(make_manager: ManagerFactory) -> None:
+    """Test that StateManager creates empty state if file doesn't exist"""
+    manager, _ = make_manager()
     state = manager.load()
 
-    assert state == initial_state
-    Path(state_path).unlink()
+    assert state == {}
 
 
-def test_state_manager_updates_channel_state() -> None:
+def test_state_manager_updates_channel_state(state_manager: tuple[StateManager, Path]) -> None:
     """Test updating state for a channel"""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump({}, f)  # Write empty JSON object
-        state_path = f.name
-
-    manager = StateManager(state_path)
-    manager.load()
+    manager, _ = state_manager
 
     timestamp = "2025-01-15T15:00:00Z"
     message_id = "789012"
@@ -58,134 +59,119 @@ def test_state_manager_updates_channel_state() -> None:
     assert manager.state["test-server"]["general"]["last_export"] == timestamp
     assert manager.state["test-server"]["general"]["last_message_id"] == message_id
 
-    Path(state_path).unlink()
-
 
-def test_state_manager_saves_state() -> None:
+def test_state_manager_saves_state(state_manager: tuple[StateManager, Path]) -> None:
     """Test that state is persisted to disk"""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump({}, f)  # Write empty JSON object
-        state_path = f.name
-
-    manager = StateManager(state_path)
-    manager.load()
+    manager, state_file = state_manager
     manager.update_channel("server", "channel", "2025-01-15T15:00:00Z", "123")
-    manager.save()
 
-    # Load in new manager instance
-    manager2 = StateManager(state_path)
+    # Only the reload needs a fresh instance
+    manager2 = StateManager(str(state_file))
     state = manager2.load()
 
     assert state["server"]["channel"]["last_export"] == "2025-01-15T15:00:00Z"
-    Path(state_path).unlink()
 
 
-def test_state_manager_updates_thread_state() -> None:
+def test_state_manager_updates_thread_state(state_manager: tuple[StateManager, Path]) -> None:
     """Test that thread state is updated correctly."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        f.write("{}")
-        state_file = f.name
-
-    try:
-        manager = StateManager(state_file)
-        manager.load()
-
-        # Update thread state
-        thread_info = ThreadInfo(
-            thread_id="123456",
-            thread_name="how-to-start",
-            thread_title="How to start?",
-            last_message_id="999",
-            archived=False,
-        )
-        manager.update_thread_state(
-            server="test-server",
-            forum="questions",
-            thread_info=thread_info,
-        )
-
-        # Verify thread state was saved
-        state = manager.get_thread_state("test-server", "questions", "123456")
-
-        assert state is not None
-        assert state["name"] == "how-to-start"
-        assert state["title"] == "How to start?"
-        assert state["last_message_id"] == "999"
-        assert state["archived"] is False
-        assert "last_export" in state
-    finally:
-        Path(state_file).unlink()
-
-
-def test_state_manager_gets_thread_state() -> None:
-    """Test retrieving thread state."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        state_data = {
-            "test-server": {
-                "forums": {
-                    "questions": {
-                        "threads": {
-                            "123456": {
-                                "name": "how-to-start",
-                                "title": "How to start?",
-                                "last_export": "2025-11-14T10:00:00Z",
-                                "last_message_id": "999",
-                                "archived": False,
-                            }
-                        }
+    manager, _ = state_manager
+
+    # Update thread state
+    thread_info = ThreadInfo(
+        thread_id="123456",
+        thread_name="how-to-start",
+        thread_title="How to start?",
+        last_message_id="999",
+        archived=False,
+    )
+    manager.update_thread_state(
+        server="test-server",
+        forum="questions",
+        thread_info=thread_info,
+    )
+
+    # Verify thread state was saved
+    state = manager.get_thread_state("test-server", "questions", "123456")
+
+    assert state is not None
+    assert state["name"] == "how-to-start"
+    assert state["title"] == "How to start?"
+    assert state["last_message_id"] == "999"
+    assert state["archived"] is False
+    assert "last_export" in state
+
+
+def test_state_manager_updates_forum_index_timestamp(
+    state_manager: tuple[StateManager, Path],
+) -> None:
+    """Test updating forum index update timestamp."""
+    manager, _ = state_manager
+
+    manager.update_forum_index_timestamp("test-server", "questions")
+
+    # Verify forum has last_index_update
+    state = manager.state
+    assert "test-server" in state
+    assert "forums" in state["test-server"]
+    assert "questions" in state["test-server"]["forums"]
+    assert "last_index_update" in state["test-server"]["forums"]["questions"]
+
+
+# Channel and thread state the read-only tests below all look up
+SHARED_STATE = {
+    "wafer-space": {
+        "general": {"last_export": "2025-01-15T14:00:00Z", "last_message_id": "123456"}
+    },
+    "test-server": {
+        "forums": {
+            "questions": {
+                "threads": {
+                    "123456": {
+                        "name": "how-to-start",
+                        "title": "How to start?",
+                        "last_export": "2025-11-14T10:00:00Z",
+                        "last_message_id": "999",
+                        "archived": False,
                     }
                 }
             }
         }
-        json.dump(state_data, f)
-        state_file = f.name
+    },
+}
 
-    try:
-        manager = StateManager(state_file)
-        manager.load()
-        state = manager.get_thread_state("test-server", "questions", "123456")
-
-        assert state is not None
-        assert state["name"] == "how-to-start"
-        assert state["title"] == "How to start?"
-        assert state["last_message_id"] == "999"
-    finally:
-        Path(state_file).unlink()
 
+class TestStateManager:
+    """Read-only lookups against one state file, written and loaded once per class.
 
-def test_state_manager_thread_state_returns_none_if_missing() -> None:
-    """Test that get_thread_state returns None for non-existent threads."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        f.write("{}")
-        state_file = f.name
+    Nothing here mutates the manager; tests that update or save state use the
+    function-scoped `state_manager` fixture instead.
+    """
 
-    try:
-        manager = StateManager(state_file)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def shared(cls, tmp_path_factory: pytest.TempPathFactory) -> StateManager:
+        """A `StateManager` loaded from `SHARED_STATE`."""
+        state_file = tmp_path_factory.mktemp("state") / "state.json"
+        state_file.write_text(json.dumps(SHARED_STATE))
+        manager = StateManager(str(state_file))
         manager.load()
-        state = manager.get_thread_state("test-server", "questions", "123456")
-
-        assert state is None
-    finally:
-        Path(state_file).unlink()
+        return manager
 
+    def test_loads_existing_state(self, shared: StateManager) -> None:
+        """Test that StateManager loads existing state"""
+        assert shared.state == SHARED_STATE
 
-def test_state_manager_updates_forum_index_timestamp() -> None:
-    """Test updating forum index update timestamp."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        f.write("{}")
-        state_file = f.name
-
-    try:
-        manager = StateManager(state_file)
-        manager.load()
+    def test_gets_thread_state(self, shared: StateManager) -> None:
+        """Test retrieving thread state."""
+        state = shared.get_thread_state("test-server", "questions", "123456")
 
-        manager.update_forum_index_timestamp("test-server", "questions")
+        assert state is not None
+        assert state["name"] == "how-to-start"
+        assert state["title"] == "How to start?"
+        assert state["last_message_id"] == "999"
 
-        # Verify forum has last_index_update
-        state = manager.state
-        assert "test-server" in state
-        assert "forums" in state["test-server"]
-        assert "questions" in state["test-server"]["forums"]
-        assert "last_index_update" in state["test-server"]["forums"]["questions"]
-    finally:
-        Path(state_file).unlink()
+    def test_thread_state_returns_none_if_missing(self, shared: StateManager) -> None:
+        """Test that get_thread_state returns None for non-existent threads."""
+        assert shared.get_thread_state("test-server", "questions", "654321") is None
+        assert shared.get_thread_state("test-server", "announcements", "123456") is None
+        assert shared.get_thread_state("other-server", "questions", "123456") is None
@@ -1,8 +1,60 @@
 """Tests for Jinja2 template rendering."""
 
+import os
+import re
 from pathlib import Path
-
-from jinja2 import Environment, FileSystemLoader
+from typing import Any
+
+import pytest
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+# Navigation page templates rendered by generate_navigation
+PAGE_TEMPLATES = [
+    "site_index.html.j2",
+    "server_index.html.j2",
+    "channel_index.html.j2",
+    "forum_index.html.j2",
+]
+
+
+# Discord dark-theme markers; each group is satisfied by either alternative
+CSS_THEME_TOKENS = re.compile(
+    r"(?P<background>--bg-primary|background)"
+    r"|(?P<text>--text-primary|color)"
+    r"|(?P<accent>--accent|(?i:#7289da))"
+)
+
+
+@pytest.fixture(scope="session")
+def css_content() -> str:
+    """The version-controlled stylesheet, read once per session."""
+    return Path("assets/style.css").read_text()
+
+
+@pytest.fixture(scope="session")
+def template_sources() -> dict[str, str]:
+    """Raw source of each page template, read once per session."""
+    return {name: Path("templates", name).read_text() for name in PAGE_TEMPLATES}
+
+
+@pytest.fixture(scope="session")
+def jinja_env() -> Environment:
+    """One Environment for every render test, so each template compiles once.
+
+    `auto_reload=False` skips the per-`get_template` mtime check; the
+    templates don't change mid-run. With `JINJA_BYTECODE_CACHE=1`, compiled
+    templates also persist in `.jinja_cache/` across pytest runs (Jinja
+    keys each entry on the source checksum, so edits still recompile).
+    """
+    bytecode_cache = None
+    if os.environ.get("JINJA_BYTECODE_CACHE") == "1":
+        os.makedirs(".jinja_cache", exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(".jinja_cache")
+    return Environment(
+        loader=FileSystemLoader("templates"),
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
 
 
 def test_templates_directory_exists() -> None:
@@ -12,22 +64,10 @@ def test_templates_directory_exists() -> None:
     assert templates_dir.is_dir(), "templates/ should be a directory"
 
 
-def test_site_index_template_exists() -> None:
-    """Test that site_index.html.j2 exists"""
-    template_path = Path("templates/site_index.html.j2")
-    assert template_path.exists(), "site_index.html.j2 should exist"
-
-
-def test_server_index_template_exists() -> None:
-    """Test that server_index.html.j2 exists"""
-    template_path = Path("templates/server_index.html.j2")
-    assert template_path.exists(), "server_index.html.j2 should exist"
-
-
-def test_channel_index_template_exists() -> None:
-    """Test that channel_index.html.j2 exists"""
-    template_path = Path("templates/channel_index.html.j2")
-    assert template_path.exists(), "channel_index.html.j2 should exist"
+@pytest.mark.parametrize("template_name", PAGE_TEMPLATES)
+def test_page_template_exists(template_name: str) -> None:
+    """Each navigation page template is present under templates/."""
+    assert Path("templates", template_name).exists(), f"{template_name} should exist"
 
 
 def test_css_file_exists() -> None:
@@ -38,151 +78,121 @@ def test_css_file_exists() -> None:
     assert css_path.exists(), "assets/style.css should exist"
 
 
-def test_site_index_template_renders() -> None:
-    """Test that site_index template can be rendered"""
-    env = Environment(loader=FileSystemLoader("templates"))
-    template = env.get_template("site_index.html.j2")
-
-    # Render with minimal data
-    html = template.render(
-        site={"title": "Test Site", "description": "Test Description"},
-        servers=[
-            {
-                "name": "test-server",
-                "display_name": "Test Server",
-                "channel_count": 5,
-                "last_updated": "2025-01-15 14:00 UTC",
-            }
-        ],
-        last_updated="2025-01-15 14:00 UTC",
-    )
-
-    # Verify basic structure
-    assert "<!DOCTYPE html>" in html
-    assert "Test Site" in html
-    assert "Test Description" in html
-    assert "Test Server" in html
-
-
-def test_server_index_template_renders() -> None:
-    """Test that server_index template can be rendered"""
-    env = Environment(loader=FileSystemLoader("templates"))
-    template = env.get_template("server_index.html.j2")
-
-    channel = {
-        "name": "general",
-        "display_name": "general",
-        "message_count": 100,
-        "archive_count": 3,
-        "archives": [
-            {"date": "2025-01", "message_count": 50},
-            {"date": "2024-12", "message_count": 30},
+SERVER_CHANNEL = {
+    "name": "general",
+    "display_name": "general",
+    "message_count": 100,
+    "archive_count": 3,
+    "archives": [
+        {"date": "2025-01", "message_count": 50},
+        {"date": "2024-12", "message_count": 30},
+    ],
+}
+
+RENDER_CASES = [
+    pytest.param(
+        "site_index.html.j2",
+        {
+            "site": {"title": "Test Site", "description": "Test Description"},
+            "servers": [
+                {
+                    "name": "test-server",
+                    "display_name": "Test Server",
+                    "channel_count": 5,
+                    "last_updated": "2025-01-15 14:00 UTC",
+                }
+            ],
+            "last_updated": "2025-01-15 14:00 UTC",
+        },
+        ["<!DOCTYPE html>", "Test Site", "Test Description", "Test Server"],
+        id="site-index",
+    ),
+    pytest.param(
+        "server_index.html.j2",
+        {
+            "site": {"title": "Test Site"},
+            "server": {"name": "test-server", "display_name": "Test Server"},
+            "channels": [SERVER_CHANNEL],
+            "categories": [{"name": "Information", "channels": [SERVER_CHANNEL]}],
+        },
+        # "Information" is the category heading (issue #5)
+        ["<!DOCTYPE html>", "Test Server", "#general", "Information"],
+        id="server-index",
+    ),
+    pytest.param(
+        "channel_index.html.j2",
+        {
+            "site": {"title": "Test Site"},
+            "server": {"name": "test-server", "display_name": "Test Server"},
+            "channel": {"name": "general"},
+            "archives_by_year": {
+                "2025": [{"date": "2025-01", "message_count": 100}],
+                "2024": [{"date": "2024-12", "message_count": 150}],
+            },
+        },
+        ["<!DOCTYPE html>", "#general", "2025", "2024"],
+        id="channel-index",
+    ),
+    pytest.param(
+        "forum_index.html.j2",
+        {
+            "site": {"title": "Test Site"},
+            "server": {"name": "wafer-space", "display_name": "wafer.space"},
+            "forum_name": "Questions",
+            "forum_description": "Ask questions about the project",
+            "threads": [
+                {
+                    "title": "How do I start?",
+                    "url": "how-do-i-start/",
+                    "reply_count": 5,
+                    "last_activity": "2025-11-10",
+                    "archived": False,
+                },
+                {
+                    "title": "Old Question",
+                    "url": "old-question/",
+                    "reply_count": 12,
+                    "last_activity": "2025-01-15",
+                    "archived": True,
+                },
+            ],
+        },
+        [
+            "<!DOCTYPE html>",
+            "Questions",
+            "Ask questions about the project",
+            # Thread cards, with the archived badge on the old one
+            "How do I start?",
+            "5 replies",
+            "Old Question",
+            "Archived",
+            "breadcrumb",
+            "/assets/style.css",
         ],
-    }
-    html = template.render(
-        site={"title": "Test Site"},
-        server={"name": "test-server", "display_name": "Test Server"},
-        channels=[channel],
-        categories=[{"name": "Information", "channels": [channel]}],
-    )
+        id="forum-index",
+    ),
+]
 
-    assert "<!DOCTYPE html>" in html
-    assert "Test Server" in html
-    assert "#general" in html
-    assert "Information" in html  # category heading (issue #5)
 
+@pytest.mark.parametrize(("template_name", "context", "expected"), RENDER_CASES)
+def test_template_renders(
+    jinja_env: Environment, template_name: str, context: dict[str, Any], expected: list[str]
+) -> None:
+    """Each page template renders its minimal context into the expected text."""
+    html = jinja_env.get_template(template_name).render(**context)
 
-def test_channel_index_template_renders() -> None:
-    """Test that channel_index template can be rendered"""
-    env = Environment(loader=FileSystemLoader("templates"))
-    template = env.get_template("channel_index.html.j2")
+    for text in expected:
+        assert text in html, f"{template_name} should render {text!r}"
 
-    html = template.render(
-        site={"title": "Test Site"},
-        server={"name": "test-server", "display_name": "Test Server"},
-        channel={"name": "general"},
-        archives_by_year={
-            "2025": [{"date": "2025-01", "message_count": 100}],
-            "2024": [{"date": "2024-12", "message_count": 150}],
-        },
-    )
 
-    assert "<!DOCTYPE html>" in html
-    assert "#general" in html
-    assert "2025" in html
-    assert "2024" in html
-
-
-def test_css_contains_discord_theme() -> None:
+def test_css_contains_discord_theme(css_content: str) -> None:
     """Test that CSS contains Discord-themed colors"""
-    css_path = Path("assets/style.css")
-    css_content = css_path.read_text()
+    # Check for Discord dark theme colors, in one pass over the stylesheet
+    found = {match.lastgroup for match in CSS_THEME_TOKENS.finditer(css_content)}
+    assert found == {"background", "text", "accent"}
 
-    # Check for Discord dark theme colors
-    assert "--bg-primary" in css_content or "background" in css_content
-    assert "--text-primary" in css_content or "color" in css_content
-    assert "--accent" in css_content or "#7289da" in css_content.lower()
 
-
-def test_templates_use_css_link() -> None:
+def test_templates_use_css_link(template_sources: dict[str, str]) -> None:
     """Test that templates link to style.css"""
-    for template_name in ["site_index.html.j2", "server_index.html.j2", "channel_index.html.j2"]:
-        template_path = Path(f"templates/{template_name}")
-        content = template_path.read_text()
+    for template_name, content in template_sources.items():
         assert "/assets/style.css" in content, f"{template_name} should link to style.css"
-
-
-def test_forum_index_template_exists() -> None:
-    """Test that forum index template exists."""
-    template_path = Path("templates/forum_index.html.j2")
-    assert template_path.exists(), "Forum index template should exist"
-
-
-def test_forum_index_template_renders() -> None:
-    """Test that forum index template renders with thread data."""
-    env = Environment(loader=FileSystemLoader("templates"))
-    template = env.get_template("forum_index.html.j2")
-
-    thread_data = [
-        {
-            "title": "How do I start?",
-            "url": "how-do-i-start/",
-            "reply_count": 5,
-            "last_activity": "2025-11-10",
-            "archived": False,
-        },
-        {
-            "title": "Old Question",
-            "url": "old-question/",
-            "reply_count": 12,
-            "last_activity": "2025-01-15",
-            "archived": True,
-        },
-    ]
-
-    result = template.render(
-        site={"title": "Test Site"},
-        server={"name": "wafer-space", "display_name": "wafer.space"},
-        forum_name="Questions",
-        forum_description="Ask questions about the project",
-        threads=thread_data,
-    )
-
-    # Verify basic structure
-    assert "<!DOCTYPE html>" in result
-    assert "Questions" in result
-    assert "Ask questions about the project" in result
-
-    # Verify thread content
-    assert "How do I start?" in result
-    assert "5 replies" in result
-    assert "Old Question" in result
-
-    # Verify archived status is shown
-    assert "Archived" in result or "archived" in result
-
-    # Verify breadcrumb navigation
-    assert "breadcrumb" in result
-
-    # Verify CSS link
-    assert "/assets/style.css" in result
@@ -1,109 +1,263 @@
 """Tests for thread metadata extraction."""
 
-import json
-import tempfile
+import mmap
+import os
+from collections.abc import Callable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
-from scripts.thread_metadata import extract_thread_metadata
+import orjson
+import pytest
+
+from scripts.thread_metadata import (
+    _summarize_file,
+    extract_many_thread_metadata,
+    extract_thread_metadata,
+    extract_thread_metadata_from_dict,
+)
 
 # Test constants
 EXPECTED_REPLY_COUNT = 3
 
+# "Now" for every frozen_now test: two months after BASIC_THREAD's last message
+FROZEN_NOW = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+# write_thread_json(data, name="thread.json") -> path of the written export
+ThreadWriter = Callable[..., Path]
+
+# Three-message thread whose last activity is 2025-11-10
+BASIC_THREAD = {
+    "guild": {"name": "Test Server"},
+    "channel": {"id": "123456", "name": "How do I start?", "type": "GuildPublicThread"},
+    "messages": [
+        {"id": "1", "timestamp": "2025-11-01T10:00:00Z", "content": "First message"},
+        {"id": "2", "timestamp": "2025-11-10T15:30:00Z", "content": "Reply 1"},
+        {"id": "3", "timestamp": "2025-11-10T16:00:00Z", "content": "Reply 2"},
+    ],
+}
+
+EMPTY_THREAD = {"channel": {"name": "Empty Thread"}, "messages": []}
+
+# Thread with old messages (>6 months = archived)
+ARCHIVED_THREAD = {
+    "channel": {"name": "Old Thread"},
+    "messages": [{"id": "1", "timestamp": "2024-01-15T10:00:00Z", "content": "Old message"}],
+}
+
+
+@pytest.fixture
+def write_thread_json(tmp_path: Path) -> ThreadWriter:
+    """Write a thread export into `tmp_path` in one `orjson.dumps` + write."""
+
+    def write(data: dict[str, Any], name: str = "thread.json") -> Path:
+        json_path = tmp_path / name
+        json_path.write_bytes(orjson.dumps(data))
+        return json_path
+
+    return write
+
+
+def _invalid_json_file(directory: Path) -> Path:
+    """Write `thread.json` holding bytes that aren't JSON into `directory`."""
+    json_path = directory / "thread.json"
+    json_path.write_bytes(b"not valid json {")
+    return json_path
+
+
+def _json_array_file(directory: Path) -> Path:
+    """Write `thread.json` holding a top-level JSON array into `directory`."""
+    json_path = directory / "thread.json"
+    json_path.write_bytes(b'[{"channel": {"name": "Not a thread"}}]')
+    return json_path
+
+
+@pytest.fixture
+def frozen_now() -> Iterator[datetime]:
+    """Pin `datetime.now()` in the module so the 180-day archived check is deterministic."""
+    with patch("scripts.thread_metadata.datetime") as mock_dt:
+        mock_dt.now.return_value = FROZEN_NOW
+        yield FROZEN_NOW
+
+
+DICT_CASES = [
+    # Two months after the latest message: under the 180-day threshold
+    pytest.param(
+        BASIC_THREAD,
+        {
+            "title": "How do I start?",
+            "reply_count": EXPECTED_REPLY_COUNT,
+            "last_activity": "2025-11-10",
+            "archived": False,
+        },
+        id="basic",
+    ),
+    pytest.param(
+        EMPTY_THREAD,
+        {"title": "Empty Thread", "reply_count": 0, "last_activity": None, "archived": False},
+        id="empty-messages",
+    ),
+    pytest.param(
+        ARCHIVED_THREAD,
+        {"title": "Old Thread", "reply_count": 1, "last_activity": "2024-01-15", "archived": True},
+        id="archived",
+    ),
+    # 180 days before FROZEN_NOW's date is the newest archived day; a day later isn't
+    pytest.param(
+        {"channel": {"name": "Edge"}, "messages": [{"timestamp": "2025-07-19T23:59:59Z"}]},
+        {"title": "Edge", "reply_count": 1, "last_activity": "2025-07-19", "archived": True},
+        id="archived-at-cutoff",
+    ),
+    pytest.param(
+        {"channel": {"name": "Edge"}, "messages": [{"timestamp": "2025-07-20T00:00:00Z"}]},
+        {"title": "Edge", "reply_count": 1, "last_activity": "2025-07-20", "archived": False},
+        id="active-after-cutoff",
+    ),
+    # A last-message timestamp that isn't ISO-8601 makes the export invalid
+    pytest.param(
+        {"channel": {"name": "Bad"}, "messages": [{"id": "1", "timestamp": "yesterday"}]},
+        None,
+        id="malformed-timestamp",
+    ),
+    pytest.param(
+        {
+            "channel": {"name": "Bad"},
+            "messages": [{"id": "1", "timestamp": "2025-02-30T00:00:00Z"}],
+        },
+        None,
+        id="impossible-date",
+    ),
+    pytest.param(
+        {"channel": {"name": "Bad"}, "messages": [{"id": "1", "timestamp": "2025-11-10Tgarbage"}]},
+        None,
+        id="trailing-garbage",
+    ),
+    pytest.param(
+        {"channel": {"name": "Bad"}, "messages": [{"id": "1", "timestamp": "2025-13-45 x"}]},
+        None,
+        id="out-of-range-date",
+    ),
+]
+
+
+@pytest.mark.usefixtures("frozen_now")
+@pytest.mark.parametrize(("thread", "expected"), DICT_CASES)
+def test_extract_thread_metadata_from_dict(
+    thread: dict[str, Any], expected: dict[str, Any] | None
+) -> None:
+    """Each parsed export yields exactly the expected metadata (or None)."""
+    assert extract_thread_metadata_from_dict(thread) == expected
+
+
+def test_extract_thread_metadata_reads_export_file(write_thread_json: ThreadWriter) -> None:
+    """The path-based entry point parses the file and extracts from its contents."""
+    json_path = write_thread_json(ARCHIVED_THREAD)
 
-def test_extract_thread_metadata_basic() -> None:
-    """Recently-active thread is not marked archived.
+    expected = extract_thread_metadata_from_dict(ARCHIVED_THREAD)
+    assert extract_thread_metadata(json_path) == expected
+    # Plain string paths work without wrapping them in Path
+    assert extract_thread_metadata(str(json_path)) == expected
 
-    The archived check is "last activity > 180 days ago", so we pin
-    `datetime.now()` to make the test independent of wall-clock time.
+
+def test_extract_thread_metadata_rereads_changed_file(write_thread_json: ThreadWriter) -> None:
+    """Cached results are keyed on mtime and size, so a rewritten export is re-parsed."""
+    thread_a = {"channel": {"name": "Thread A"}, "messages": []}
+    thread_b = {"channel": {"name": "Thread B"}, "messages": []}
+    json_path = write_thread_json(thread_a)
+    assert extract_thread_metadata(json_path) == extract_thread_metadata_from_dict(thread_a)
+
+    hits = _summarize_file.cache_info().hits
+    assert extract_thread_metadata(json_path) == extract_thread_metadata_from_dict(thread_a)
+    assert _summarize_file.cache_info().hits == hits + 1
+
+    # Same size, so only the newer mtime tells the cache the file changed
+    mtime_ns = json_path.stat().st_mtime_ns + 1_000_000_000
+    write_thread_json(thread_b)
+    os.utime(json_path, ns=(mtime_ns, mtime_ns))
+
+    assert extract_thread_metadata(json_path) == extract_thread_metadata_from_dict(thread_b)
+
+
+def test_extract_thread_metadata_tells_apart_swapped_files(
+    write_thread_json: ThreadWriter,
+) -> None:
+    """A same-size file with the same mtime renamed over a cached path is re-parsed."""
+    thread_a = {"channel": {"name": "Thread A"}, "messages": []}
+    thread_b = {"channel": {"name": "Thread B"}, "messages": []}
+    json_path = write_thread_json(thread_a)
+    other_path = write_thread_json(thread_b, name="other.json")
+    mtime_ns = json_path.stat().st_mtime_ns
+    os.utime(other_path, ns=(mtime_ns, mtime_ns))
+    assert extract_thread_metadata(json_path) == extract_thread_metadata_from_dict(thread_a)
+
+    # Only the inode differs from what the cache saw at this path
+    os.replace(other_path, json_path)
+
+    assert extract_thread_metadata(json_path) == extract_thread_metadata_from_dict(thread_b)
+
+
+def test_extract_thread_metadata_memory_maps_large_file(
+    monkeypatch: pytest.MonkeyPatch, write_thread_json: ThreadWriter
+) -> None:
+    """Exports over the mmap threshold are parsed from a map that is closed afterwards."""
+    real_mmap = mmap.mmap
+    maps: list[mmap.mmap] = []
+
+    def spy_mmap(*args: Any, **kwargs: Any) -> mmap.mmap:
+        mm = real_mmap(*args, **kwargs)
+        maps.append(mm)
+        return mm
+
+    monkeypatch.setattr("scripts.thread_metadata._MMAP_MIN_BYTES", 0)
+    monkeypatch.setattr("scripts.thread_metadata.mmap.mmap", spy_mmap)
+    json_path = write_thread_json(BASIC_THREAD)
+
+    assert extract_thread_metadata(json_path) == extract_thread_metadata_from_dict(BASIC_THREAD)
+    assert len(maps) == 1
+    # Closing would raise BufferError had the memoryview not been released first
+    assert maps[0].closed
+
+
+@pytest.mark.parametrize(
+    "make_path",
+    [
+        pytest.param(lambda tmp: str(tmp / "missing.json"), id="missing-file-str"),
+        # A directory where the export should be is treated like a missing file
+        pytest.param(lambda tmp: tmp, id="not-a-file"),
+        pytest.param(_invalid_json_file, id="invalid-json"),
+        # Valid JSON, but not an object, so not an export
+        pytest.param(_json_array_file, id="not-an-object"),
+    ],
+)
+def test_extract_thread_metadata_unreadable_returns_none(
+    tmp_path: Path, make_path: Callable[[Path], str | Path]
+) -> None:
+    """Paths that can't be read as a JSON export yield None rather than raising."""
+    assert extract_thread_metadata(make_path(tmp_path)) is None
+
+
+def test_extract_many_thread_metadata_matches_serial_in_order(
+    tmp_path: Path, write_thread_json: ThreadWriter
+) -> None:
+    """The process-pool path returns exactly the serial results, in input order.
+
+    Enough files to cross the parallel threshold; every fifth one is invalid
+    so the None results have to land in the right slots too.
     """
-    thread_json = {
-        "guild": {"name": "Test Server"},
-        "channel": {"id": "123456", "name": "How do I start?", "type": "GuildPublicThread"},
-        "messages": [
-            {"id": "1", "timestamp": "2025-11-01T10:00:00Z", "content": "First message"},
-            {"id": "2", "timestamp": "2025-11-10T15:30:00Z", "content": "Reply 1"},
-            {"id": "3", "timestamp": "2025-11-10T16:00:00Z", "content": "Reply 2"},
-        ],
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(thread_json, f)
-        temp_path = Path(f.name)
-
-    try:
-        # Pretend "now" is two months after the latest message — less than the
-        # 180-day archived threshold, so archived must be False.
-        with patch("scripts.thread_metadata.datetime") as mock_dt:
-            mock_dt.now.return_value = datetime(2026, 1, 15, tzinfo=timezone.utc)
-            mock_dt.fromisoformat.side_effect = datetime.fromisoformat
-            metadata = extract_thread_metadata(temp_path)
-
-        assert metadata is not None
-        assert metadata["title"] == "How do I start?"
-        assert metadata["reply_count"] == EXPECTED_REPLY_COUNT
-        assert metadata["last_activity"] == "2025-11-10"
-        assert metadata["archived"] is False
-    finally:
-        temp_path.unlink()
-
-
-def test_extract_thread_metadata_empty_messages() -> None:
-    """Test metadata extraction with no messages."""
-    thread_json = {"channel": {"name": "Empty Thread"}, "messages": []}
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(thread_json, f)
-        temp_path = Path(f.name)
-
-    try:
-        metadata = extract_thread_metadata(temp_path)
-
-        assert metadata is not None
-        assert metadata["title"] == "Empty Thread"
-        assert metadata["reply_count"] == 0
-        assert metadata["last_activity"] is None
-    finally:
-        temp_path.unlink()
-
-
-def test_extract_thread_metadata_archived() -> None:
-    """Test metadata extraction for archived thread."""
-    # Thread with old messages (>6 months = archived)
-    thread_json = {
-        "channel": {"name": "Old Thread"},
-        "messages": [{"id": "1", "timestamp": "2024-01-15T10:00:00Z", "content": "Old message"}],
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(thread_json, f)
-        temp_path = Path(f.name)
-
-    try:
-        metadata = extract_thread_metadata(temp_path)
-
-        assert metadata is not None
-        assert metadata["archived"] is True
-    finally:
-        temp_path.unlink()
-
-
-def test_extract_thread_metadata_missing_file() -> None:
-    """Test handling of missing JSON file."""
-    result = extract_thread_metadata(Path("/nonexistent/file.json"))
-
-    assert result is None
-
-
-def test_extract_thread_metadata_invalid_json() -> None:
-    """Test handling of invalid JSON."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        f.write("not valid json {")
-        temp_path = Path(f.name)
-
-    try:
-        result = extract_thread_metadata(temp_path)
-        assert result is None
-    finally:
-        temp_path.unlink()
+    json_paths = []
+    for i in range(70):
+        if i % 5 == 0:
+            json_path = tmp_path / f"thread-{i}.json"
+            json_path.write_bytes(b"not valid json {")
+        else:
+            thread = {"channel": {"name": f"Thread {i}"}, "messages": [{"id": "1"}] * i}
+            json_path = write_thread_json(thread, f"thread-{i}.json")
+        json_paths.append(json_path)
+
+    results = extract_many_thread_metadata(json_paths, max_workers=2)
+
+    assert results == [extract_thread_metadata(path) for path in json_paths]
+    assert results[0] is None
+    assert results[7] is not None
+    assert results[7]["title"] == "Thread 7"